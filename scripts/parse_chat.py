@@ -6,8 +6,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
-
-import sys
+from typing import Optional, Sequence
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
@@ -16,7 +15,7 @@ if str(PROJECT_ROOT) not in sys.path:
 from src.parser_agent import ParserAgent
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Parse WhatsApp _chat.txt into JSONL")
     parser.add_argument(
         "--root",
@@ -24,18 +23,20 @@ def parse_args() -> argparse.Namespace:
         required=True,
         help="Path to export root or _chat.txt file",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
     agent = ParserAgent(root=str(args.root))
     messages = agent.parse()
 
+    # json.dumps per message (json.dump streams many tiny chunks), then one stdout write.
+    lines = []
     for msg in messages:
         payload = msg.model_dump() if hasattr(msg, "model_dump") else msg.dict()  # type: ignore[attr-defined]
-        json.dump(payload, sys.stdout, ensure_ascii=False)
-        sys.stdout.write("\n")
+        lines.append(json.dumps(payload, ensure_ascii=False) + "\n")
+    sys.stdout.write("".join(lines))
 
     return 0
 
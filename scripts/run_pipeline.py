@@ -6,6 +6,10 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    from src.pipeline.config import PipelineConfig
 
 
 def _bootstrap_paths() -> None:
@@ -31,17 +35,15 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def parse_args() -> argparse.Namespace:
-    return _build_parser().parse_args()
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
 
 
-def main() -> int:
+def _main_with_config(cfg: PipelineConfig) -> int:
+    """Run the pipeline for an already-built config and print the result summary."""
     _bootstrap_paths()
-    from src.pipeline.config import PipelineConfig
     from src.pipeline.runner import run_pipeline
 
-    args = parse_args()
-    cfg = PipelineConfig.from_args(args)
     result = run_pipeline(cfg)
     print(
         f"run_id={result['run_id']} run_dir={result['run_dir']} "
@@ -51,5 +53,12 @@ def main() -> int:
     return 0
 
 
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    _bootstrap_paths()
+    from src.pipeline.config import PipelineConfig
+
+    return _main_with_config(PipelineConfig.from_args(parse_args(argv)))
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -7,6 +7,7 @@ import argparse
 import sys
 import tempfile
 from pathlib import Path
+from typing import Optional, Sequence
 
 
 def _bootstrap_paths() -> None:
@@ -16,7 +17,7 @@ def _bootstrap_paths() -> None:
         sys.path.insert(0, str(repo_root))
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Transcribe WhatsApp voice messages.")
     parser.add_argument("--root", required=True, help="Path to chat folder or _chat.txt")
     parser.add_argument(
@@ -24,17 +25,17 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable cache writes (use a temp cache directory for this run).",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
+def main(argv: Optional[Sequence[str]] = None) -> int:
     _bootstrap_paths()
 
     from src.parser_agent import ParserAgent
     from src.media_resolver import MediaResolver
     from src.audio_transcriber import AudioTranscriber, AudioConfig
 
-    args = parse_args()
+    args = parse_args(argv)
     root_path = Path(args.root)
 
     parser = ParserAgent(str(root_path))
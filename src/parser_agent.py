@@ -13,6 +13,31 @@ from typing import Optional, Tuple
 from src.schema.message import Message, StatusReason
 from src.utils.dates import detect_datetime_format, normalize_timestamp_text, parse_ts
 
+# Classification patterns, compiled once at import.
+_FILE_ATTACHED_RE = re.compile(
+    r"(?i)^(?P<fname>(IMG|VID|PTT|AUD|DOC)-\d{8}-WA\d+\.[A-Za-z0-9]+) \(file attached\)$"
+)
+_VOICE_HINT_RE = re.compile(r"(?i)^voice message \((\d+):(\d{2})\)$")
+
+# Media omitted placeholders
+_PLACEHOLDER_MAP = {
+    "<image omitted>": ("image", "image_omitted"),
+    "<video omitted>": ("video", "video_omitted"),
+    "<document omitted>": ("document", "document_omitted"),
+    "<media omitted>": ("unknown", "media_omitted"),
+}
+
+# System line patterns (common WhatsApp notices)
+_SYSTEM_PATTERNS = (
+    "messages and calls are end-to-end encrypted",
+    "you created group",
+    "you were added",
+    "added",
+    "removed",
+    "changed this group's icon",
+    "changed the subject from",
+)
+
 
 @dataclass
 class ParserAgent:
@@ -146,10 +171,7 @@ class ParserAgent:
         content_text = body
 
         # Fast path: explicit filename with "(file attached)"
-        fname_match = re.match(
-            r"(?i)^(?P<fname>(IMG|VID|PTT|AUD|DOC)-\d{8}-WA\d+\.[A-Za-z0-9]+) \(file attached\)$",
-            body,
-        )
+        fname_match = _FILE_ATTACHED_RE.match(body)
         if fname_match:
             fname = fname_match.group("fname")
             media_hint = fname
@@ -167,34 +189,17 @@ class ParserAgent:
 
         lower_body = body.lower()
 
-        # Media omitted placeholders
-        placeholder_map = {
-            "<image omitted>": ("image", "image_omitted"),
-            "<video omitted>": ("video", "video_omitted"),
-            "<document omitted>": ("document", "document_omitted"),
-            "<media omitted>": ("unknown", "media_omitted"),
-        }
-        if lower_body in placeholder_map:
-            kind, media_hint = placeholder_map[lower_body]
+        if lower_body in _PLACEHOLDER_MAP:
+            kind, media_hint = _PLACEHOLDER_MAP[lower_body]
             content_text = ""
             return kind, media_hint, content_text
 
-        # System line patterns (common WhatsApp notices)
-        system_patterns = [
-            "messages and calls are end-to-end encrypted",
-            "you created group",
-            "you were added",
-            "added",
-            "removed",
-            "changed this group's icon",
-            "changed the subject from",
-        ]
-        if any(pat in lower_body for pat in system_patterns):
+        if any(pat in lower_body for pat in _SYSTEM_PATTERNS):
             kind = "system"
             return kind, media_hint, content_text
 
         # Voice message textual hints
-        voice_match = re.match(r"(?i)^voice message \((\d+):(\d{2})\)$", body)
+        voice_match = _VOICE_HINT_RE.match(body)
         if voice_match:
             minutes, seconds = voice_match.groups()
             media_hint = f"{int(minutes):02d}:{seconds}"
@@ -34,6 +34,7 @@ class PipelineConfig:
     sample_limit: Optional[int] = None
     sample_every: Optional[int] = None
     resume: bool = True
+    resume_from_m1: Optional[Path] = None
 
     def __post_init__(self) -> None:
         self.root = Path(self.root).resolve()
@@ -43,6 +44,8 @@ class PipelineConfig:
         self.run_id = _slugify(self.run_id or self.root.name or "run")
         run_dir = self.run_dir or (self.root / "runs" / self.run_id)
         self.run_dir = Path(run_dir).resolve()
+        if self.resume_from_m1 is not None:
+            self.resume_from_m1 = Path(self.resume_from_m1).resolve()
 
         if self.sample_every is not None and self.sample_every <= 0:
             raise ValueError("sample_every must be > 0 when provided")
@@ -74,6 +77,11 @@ class PipelineConfig:
             raise FileNotFoundError(f"root directory not found: {self.root}")
         if not self.chat_file.exists():
             raise FileNotFoundError(f"chat export not found: {self.chat_file}")
+        if self.resume_from_m1 is not None:
+            if self.sample_limit is not None or self.sample_every is not None:
+                raise ValueError("resume_from_m1 cannot be combined with sample_limit/sample_every")
+            if not self.resume_from_m1.exists():
+                raise FileNotFoundError(f"M1 messages not found: {self.resume_from_m1}")
 
     @property
     def manifest_path(self) -> Path:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional
 
@@ -130,6 +131,15 @@ def _get_metrics_schema() -> dict[str, Any]:
     return json.loads(schema_path.read_text(encoding="utf-8"))
 
 
+@lru_cache(maxsize=1)
+def _get_metrics_validator() -> Any:
+    """Build (and check) the metrics schema validator once per process."""
+    schema = _get_metrics_schema()
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 def validate_metrics(data: dict[str, Any]) -> None:
     """Validate a metrics dict against the JSON schema.
 
@@ -147,5 +157,7 @@ def validate_metrics(data: dict[str, Any]) -> None:
             "Install with: pip install jsonschema"
         )
 
-    schema = _get_metrics_schema()
-    jsonschema.validate(data, schema)
+    # Same error selection as jsonschema.validate, without recompiling the schema.
+    error = jsonschema.exceptions.best_match(_get_metrics_validator().iter_errors(data))
+    if error is not None:
+        raise error
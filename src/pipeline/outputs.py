@@ -22,12 +22,15 @@ def load_messages(path: Path) -> List[Message]:
 
 def write_messages_jsonl(messages: Iterable[Message], path: Path) -> None:
     """Write Message[] to JSONL deterministically."""
+    lines: List[str] = []
+    for msg in messages:
+        if hasattr(msg, "model_dump"):
+            data = msg.model_dump()
+        else:
+            data = msg.dict()
+        lines.append(json.dumps(data, ensure_ascii=False, default=str) + "\n")
+
+    # Serialize everything first, then hand the file a single write.
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8", newline="\n") as fh:
-        for msg in messages:
-            if hasattr(msg, "model_dump"):
-                data = msg.model_dump()
-            else:
-                data = msg.dict()
-            fh.write(json.dumps(data, ensure_ascii=False, default=str))
-            fh.write("\n")
+        fh.write("".join(lines))
@@ -6,6 +6,7 @@ import concurrent.futures
 import contextlib
 import copy
 import os
+import shutil
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -203,6 +204,14 @@ def _run_m1(cfg: PipelineConfig, manifest: RunManifest) -> List[Message]:
         return messages
 
     try:
+        if cfg.resume_from_m1 is not None:
+            # Seed from an already parsed M1 JSONL instead of re-parsing.
+            _begin_step(manifest, cfg, step, total=0)
+            shutil.copyfile(cfg.resume_from_m1, path)
+            messages = validate_jsonl(path)
+            _complete_step(manifest, cfg, step, total=len(messages), done=len(messages))
+            return messages
+
         parser = ParserAgent(str(cfg.root), chat_file=str(cfg.chat_file) if cfg.chat_file else None)
         _begin_step(manifest, cfg, step, total=0)
         messages = parser.parse()
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Steps shown in the UI, in pipeline order.
+_STEP_NAMES = ("M1_parse", "M2_media", "M3_audio", "M5_text")
 
 
 @dataclass
@@ -42,7 +48,7 @@ class RunSummary:
     steps: List[StepStatus] = field(default_factory=list)
 
 
-def list_runs(root: str) -> List[RunSummary]:
+def list_runs(root: PathLike) -> List[RunSummary]:
     """Find all runs under root and return summaries.
 
     Looks for directories matching 'runs/*' pattern with run_manifest.json.
@@ -54,7 +60,9 @@ def list_runs(root: str) -> List[RunSummary]:
         List of RunSummary objects, sorted by start_time (newest first)
     """
     root_path = Path(root)
-    runs_dir = root_path / "runs" if (root_path / "runs").is_dir() else root_path
+    runs_dir = root_path / "runs"
+    if not runs_dir.is_dir():
+        runs_dir = root_path
 
     summaries: List[RunSummary] = []
 
@@ -67,7 +75,7 @@ def list_runs(root: str) -> List[RunSummary]:
             continue
 
         try:
-            summary = load_run_summary(str(run_dir))
+            summary = load_run_summary(run_dir)
             summaries.append(summary)
         except Exception:
             # Skip invalid runs but don't crash
@@ -82,7 +90,7 @@ def list_runs(root: str) -> List[RunSummary]:
     return summaries
 
 
-def load_run_summary(run_dir: str) -> RunSummary:
+def load_run_summary(run_dir: PathLike) -> RunSummary:
     """Load a single run's manifest and metrics into a summary.
 
     Args:
@@ -99,26 +107,25 @@ def load_run_summary(run_dir: str) -> RunSummary:
     manifest_path = run_path / "run_manifest.json"
     metrics_path = run_path / "metrics.json"
 
-    # Load manifest (required)
-    with manifest_path.open("r", encoding="utf-8") as f:
-        manifest: Dict[str, Any] = json.load(f)
+    # Load manifest (required); json.loads decodes the UTF-8 bytes itself
+    manifest: Dict[str, Any] = json.loads(manifest_path.read_bytes())
 
     # Load metrics (optional)
     metrics: Dict[str, Any] = {}
     if metrics_path.exists():
         try:
-            with metrics_path.open("r", encoding="utf-8") as f:
-                metrics = json.load(f)
+            metrics = json.loads(metrics_path.read_bytes())
         except (json.JSONDecodeError, IOError):
             pass  # Use empty metrics if invalid
 
     # Determine overall status from steps
     steps_data = manifest.get("steps", {})
-    status = _determine_status(steps_data, manifest.get("summary", {}))
+    summary_data = manifest.get("summary", {})
+    status = _determine_status(steps_data, summary_data)
 
     # Build step list
     steps: List[StepStatus] = []
-    for step_name in ["M1_parse", "M2_media", "M3_audio", "M5_text"]:
+    for step_name in _STEP_NAMES:
         step_data = steps_data.get(step_name, {})
         steps.append(StepStatus(
             name=step_data.get("name", step_name),
@@ -141,18 +148,18 @@ def load_run_summary(run_dir: str) -> RunSummary:
         status=status,
         start_time=manifest.get("start_time"),
         end_time=manifest.get("end_time"),
-        messages_total=manifest.get("summary", {}).get("messages_total", 0),
-        voice_total=manifest.get("summary", {}).get("voice_total", 0),
+        messages_total=summary_data.get("messages_total", 0),
+        voice_total=summary_data.get("voice_total", 0),
         voice_ok=voice_status.get("ok", 0),
         voice_failed=voice_status.get("failed", 0),
         audio_seconds=metrics.get("audio_seconds_total", 0.0),
         asr_cost_usd=metrics.get("asr_cost_total_usd", 0.0),
-        error=manifest.get("summary", {}).get("error"),
+        error=summary_data.get("error"),
         steps=steps,
     )
 
 
-def load_transcript_preview(run_dir: str) -> List[str]:
+def load_transcript_preview(run_dir: PathLike) -> List[str]:
     """Load transcript preview lines from a run.
 
     Args:
@@ -167,12 +174,43 @@ def load_transcript_preview(run_dir: str) -> List[str]:
         return []
 
     try:
-        text = preview_path.read_text(encoding="utf-8")
-        return text.splitlines()
+        data = preview_path.read_bytes()
+        if not data:
+            return []
+        # Split on b"\n" in bytes and decode per line; tolerate CRLF files.
+        raw_lines = data.split(b"\n")
+        if raw_lines[-1] == b"":
+            raw_lines.pop()
+        return [
+            (ln[:-1] if ln.endswith(b"\r") else ln).decode("utf-8") for ln in raw_lines
+        ]
     except (IOError, UnicodeDecodeError):
         return []
 
 
+def count_transcript_preview_lines(run_dir: PathLike) -> int:
+    """Count transcript preview lines without loading them.
+
+    Streams the file in binary mode, so memory stays constant for long previews.
+
+    Args:
+        run_dir: Path to the run directory
+
+    Returns:
+        Number of preview lines, or 0 if the file is missing/unreadable
+    """
+    preview_path = Path(run_dir) / "preview_transcripts.txt"
+
+    if not preview_path.exists():
+        return 0
+
+    try:
+        with preview_path.open("rb") as fh:
+            return sum(1 for _ in fh)
+    except IOError:
+        return 0
+
+
 def _determine_status(steps: Dict[str, Any], summary: Dict[str, Any]) -> str:
     """Determine overall run status from step statuses.
 
@@ -6,7 +6,9 @@ Implements deterministic scoring with early-line weighting.
 
 import re
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterable, Optional
 
 # Unicode whitespace variants commonly observed in WhatsApp exports.
 UNICODE_SPACE_MAP = {
@@ -16,6 +18,10 @@ UNICODE_SPACE_MAP = {
 }
 
 
+# Detection only looks at the first N non-empty lines of the export.
+DETECTION_SAMPLE_LINES = 200
+
+
 def _normalize_whitespace(text: str) -> str:
     """Replace WhatsApp-specific unicode spaces/marks with ASCII equivalents."""
     for src, replacement in UNICODE_SPACE_MAP.items():
@@ -85,14 +91,15 @@ def _match_strptime_pattern(ts_fragment: str, patterns: list[str]) -> Optional[s
     return None
 
 
-def detect_datetime_format(lines: list[str]) -> dict[str, Any]:
+def detect_datetime_format(lines: Iterable[str]) -> dict[str, Any]:
     """Auto-detect WhatsApp timestamp format from sample lines.
 
     Analyzes first ~200 non-empty lines, scores regex candidates with
     early-line weighting, and returns the winning format.
 
     Args:
-        lines: List of lines from WhatsApp chat export (typically first 200)
+        lines: Lines from WhatsApp chat export; any iterable (e.g. an open file)
+            works and is consumed only up to the sampling window
 
     Returns:
         Format dictionary with keys:
@@ -104,8 +111,12 @@ def detect_datetime_format(lines: list[str]) -> dict[str, Any]:
     Raises:
         ValueError: If no format candidates match any lines
     """
-    # Sample first 200 non-empty lines
-    sample_lines = [_normalize_whitespace(line.strip()) for line in lines if line.strip()][:200]
+    # Sample the first non-empty lines lazily; the rest of the input is never read
+    stripped = (line.strip() for line in lines)
+    sample_lines = [
+        _normalize_whitespace(line)
+        for line in islice((line for line in stripped if line), DETECTION_SAMPLE_LINES)
+    ]
 
     if not sample_lines:
         raise ValueError("No non-empty lines provided for format detection")
@@ -159,6 +170,12 @@ def detect_datetime_format(lines: list[str]) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=8192)
+def _parse_ts_core(normalized: str, strptime_pattern: str) -> str:
+    """strptime + ISO 8601 formatting; chats repeat timestamps heavily, so results are memoized."""
+    return datetime.strptime(normalized, strptime_pattern).strftime("%Y-%m-%dT%H:%M:%S")
+
+
 def parse_ts(s: str, fmt: dict[str, Any]) -> str:
     """Parse timestamp string to ISO 8601 format.
 
@@ -177,9 +194,7 @@ def parse_ts(s: str, fmt: dict[str, Any]) -> str:
     normalized = _normalize_whitespace(s.strip())
 
     try:
-        dt = datetime.strptime(normalized, strptime_pattern)
-        # Return ISO 8601 format
-        return dt.strftime("%Y-%m-%dT%H:%M:%S")
+        return _parse_ts_core(normalized, strptime_pattern)
     except ValueError as e:
         raise ValueError(
             f"Failed to parse timestamp '{s}' with pattern '{strptime_pattern}': {e}"
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable, Optional
 
 from src.schema.message import Message
 from src.writers.text_renderer import RtlMode, wrap_rtl_segments
 
+_BY_IDX = attrgetter("idx")
+
 
 @dataclass
 class MarkdownOptions:
@@ -66,7 +69,7 @@ def render_messages_to_markdown(
     options: Optional[MarkdownOptions] = None,
 ) -> dict:
     opts = options or MarkdownOptions()
-    msgs = sorted(list(messages), key=lambda m: m.idx)
+    msgs = sorted(messages, key=_BY_IDX)
     summary = {"total": 0, "voice": 0, "media": 0, "text": 0, "system": 0, "dates": 0}
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
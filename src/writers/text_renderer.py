@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, Literal, Optional
+from typing import Iterable, List, Literal, Optional
 from datetime import datetime
 
 from src.schema.message import Message
@@ -17,6 +18,10 @@ RtlMode = Literal["none", "bidi_marks"]
 RLE = "\u202B"  # Right-to-Left Embedding
 PDF = "\u202C"  # Pop Directional Formatting
 
+_ARABIC_RE = re.compile(r'[\u0600-\u06FF]')
+_ELLIPSIS = "…"
+_BY_IDX = attrgetter("idx")  # C-level sort key; output order is by idx
+
 
 @dataclass
 class TextRenderOptions:
@@ -28,7 +33,7 @@ class TextRenderOptions:
 
 def _has_arabic(text: str) -> bool:
     """Check if text contains Arabic characters (U+0600 to U+06FF)."""
-    return bool(re.search(r'[\u0600-\u06FF]', text))
+    return _ARABIC_RE.search(text) is not None
 
 
 def wrap_rtl_segments(text: str, rtl_mode: RtlMode) -> str:
@@ -117,49 +122,52 @@ def render_messages_to_txt(
     options: Optional[TextRenderOptions] = None,
 ) -> dict:
     opts = options or TextRenderOptions()
-    msgs = sorted(list(messages), key=lambda m: m.idx)
+    msgs = sorted(messages, key=_BY_IDX)
     summary = {"total": 0, "text": 0, "voice": 0, "media": 0, "system": 0}
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8", newline="\n") as f:
-        for msg in msgs:
-            if msg.kind == "system":
-                if opts.hide_system:
-                    continue
-                body = _select_body(msg)
-                # Apply RTL wrapping to system messages too
-                body = wrap_rtl_segments(body, opts.rtl_mode)
-                ts = _ts_human(msg.ts)
-                suffix = _status_suffix(msg, opts)
-                f.write(f"{ts} - SYSTEM: {body}{suffix}\n")
-                summary["system"] += 1
-                summary["total"] += 1
+    parts: List[str] = []
+    for msg in msgs:
+        if msg.kind == "system":
+            if opts.hide_system:
                 continue
-
-            if msg.status == "skipped" and getattr(msg.status_reason, "code", None) == "merged_into_previous_media":
-                continue
-
             body = _select_body(msg)
-            # Apply RTL wrapping to the entire body
+            # Apply RTL wrapping to system messages too
             body = wrap_rtl_segments(body, opts.rtl_mode)
-            lines = body.splitlines() or [""]
             ts = _ts_human(msg.ts)
             suffix = _status_suffix(msg, opts)
-
-            first_line = lines[0].strip() if opts.flatten_multiline else lines[0]
-            f.write(f"{ts} - {msg.sender}: {first_line}{suffix}\n")
-            if not opts.flatten_multiline:
-                for cont in lines[1:]:
-                    f.write(f"    {cont}\n")
-
-            # summary counts
+            parts.append(f"{ts} - SYSTEM: {body}{suffix}\n")
+            summary["system"] += 1
             summary["total"] += 1
-            if msg.kind == "voice":
-                summary["voice"] += 1
-            elif msg.kind in {"image", "video", "document"}:
-                summary["media"] += 1
-            else:
-                summary["text"] += 1
+            continue
+
+        if msg.status == "skipped" and getattr(msg.status_reason, "code", None) == "merged_into_previous_media":
+            continue
+
+        body = _select_body(msg)
+        # Apply RTL wrapping to the entire body
+        body = wrap_rtl_segments(body, opts.rtl_mode)
+        lines = body.splitlines() or [""]
+        ts = _ts_human(msg.ts)
+        suffix = _status_suffix(msg, opts)
+
+        first_line = lines[0].strip() if opts.flatten_multiline else lines[0]
+        parts.append(f"{ts} - {msg.sender}: {first_line}{suffix}\n")
+        if not opts.flatten_multiline:
+            for cont in lines[1:]:
+                parts.append(f"    {cont}\n")
+
+        # summary counts
+        summary["total"] += 1
+        if msg.kind == "voice":
+            summary["voice"] += 1
+        elif msg.kind in {"image", "video", "document"}:
+            summary["media"] += 1
+        else:
+            summary["text"] += 1
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # One bulk encode + write; lines already end in "\n", so no newline translation is needed.
+    out_path.write_bytes("".join(parts).encode("utf-8"))
 
     return summary
 
@@ -182,10 +190,10 @@ def format_preview_line(msg: Message, max_chars: int = 120) -> str:
     else:
         text = "[UNTRANSCRIBED VOICE NOTE]"
 
-    # Normalize: replace newlines, collapse spaces
-    text = " ".join(text.replace("\r", " ").replace("\n", " ").split())
+    # Normalize: str.split() already breaks on \r/\n, so this flattens and collapses spaces
+    text = " ".join(text.split())
     if len(text) > max_chars:
-        text = text[:max_chars] + "…"
+        text = text[:max_chars] + _ELLIPSIS
     text = text.replace('"', r"\"")
 
     sender = msg.sender.replace("|", " ")
@@ -194,9 +202,9 @@ def format_preview_line(msg: Message, max_chars: int = 120) -> str:
 
 def write_transcript_preview(messages: Iterable[Message], out_path: Path, max_chars: int = 120) -> int:
     """Write preview_transcripts.txt with one line per voice message (sorted by idx)."""
-    voice_msgs = sorted([m for m in messages if m.kind == "voice"], key=lambda m: m.idx)
+    voice_msgs = sorted([m for m in messages if m.kind == "voice"], key=_BY_IDX)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8", newline="\n") as f:
-        for msg in voice_msgs:
-            f.write(format_preview_line(msg, max_chars=max_chars) + "\n")
+    out_path.write_bytes(
+        "".join(format_preview_line(msg, max_chars=max_chars) + "\n" for msg in voice_msgs).encode("utf-8")
+    )
     return len(voice_msgs)
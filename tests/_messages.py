@@ -0,0 +1,12 @@
+"""Message JSONL loading shared by the renderer tests."""
+
+from pathlib import Path
+from typing import List
+
+from src.schema.message import Message
+
+
+def load_messages_jsonl(path: Path) -> List[Message]:
+    """Decode one Message per non-blank line, streaming the file."""
+    with path.open("rb") as fh:
+        return [Message.parse_raw(line) for line in fh if line.strip()]
@@ -0,0 +1,6 @@
+"""Absolute paths shared by the test modules and conftest (import this, not conftest)."""
+
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures"
@@ -1,9 +1,160 @@
+import os
 import shutil
+import sys
+from dataclasses import replace
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.audio_transcriber import AudioConfig, AudioTranscriber
+from src.parser_agent import ParserAgent
+from src.pipeline.config import PipelineConfig
+from src.pipeline.outputs import write_messages_jsonl
+from src.pipeline.runner import run_pipeline
+from src.schema.message import Message
+from src.utils.dates import detect_datetime_format
+from src.utils.hashing import sha256_file
+from tests._paths import FIXTURE_DIR, REPO_ROOT
+
+_MSG_DEFAULTS = {
+    "idx": 0,
+    "ts": "2025-01-01T00:00:00",
+    "sender": "Alice",
+    "kind": "text",
+    "content_text": "",
+}
+# Unvalidated template; copies are deep so derived/errors are never shared.
+_BASE_MSG = (
+    Message.model_construct(**_MSG_DEFAULTS)
+    if hasattr(Message, "model_construct")
+    else Message.construct(**_MSG_DEFAULTS)
+)
+
+
+def _copy_base_msg(**overrides) -> Message:
+    """Copy the template Message with ``overrides`` applied, skipping field validation."""
+    if hasattr(_BASE_MSG, "model_copy"):
+        return _BASE_MSG.model_copy(update=overrides, deep=True)
+    return _BASE_MSG.copy(update=overrides, deep=True)
+
+
+# Test-friendly audio settings; never handed out directly, only via replace().
+_BASE_AUDIO_CFG = AudioConfig(chunk_seconds=10.0, chunk_overlap_seconds=0.25)
+
+
+def _cfg_with(cache_dir: Path, **overrides) -> AudioConfig:
+    """Copy the baseline AudioConfig with ``cache_dir`` and ``overrides`` applied."""
+    return replace(_BASE_AUDIO_CFG, cache_dir=cache_dir, **overrides)
+
+
+def _load_lines(path: Path) -> Tuple[str, ...]:
+    """Read a fixture file; a tuple keeps the session-shared lines read-only."""
+    return tuple(path.read_text(encoding="utf-8").splitlines(keepends=True))
+
+
+def _touch_mtime(path: Path, when: float) -> None:
+    """Write a one-byte file and set its atime/mtime to ``when`` through a single fd."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, b"a")
+        ns = int(when * 1e9)
+        os.utime(fd if os.utime in os.supports_fd else path, ns=(ns, ns))
+    finally:
+        os.close(fd)
+
+
+# Keyed on (path, mtime_ns, size, extra) so a rewritten file is hashed again.
+_SHA256_MEMO: dict = {}
+_SHA256_CALLERS = ("src.utils.hashing", "src.indexer.media_index", "src.media_resolver")
+
+
+def _memo_sha256_file(path: Path, extra: Optional[str] = None) -> str:
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size, extra)
+    if key not in _SHA256_MEMO:
+        _SHA256_MEMO[key] = sha256_file(path, extra)
+    return _SHA256_MEMO[key]
+
+
+@pytest.fixture(scope="session")
+def repo_root() -> Path:
+    """Get repository root directory."""
+    return REPO_ROOT
+
+
+@pytest.fixture(scope="session")
+def header_lines() -> Tuple[str, ...]:
+    """Load header cases fixture."""
+    return _load_lines(FIXTURE_DIR / "text_only" / "header_cases.txt")
+
+
+@pytest.fixture(scope="session")
+def multiline_lines() -> Tuple[str, ...]:
+    """Load multiline cases fixture."""
+    return _load_lines(FIXTURE_DIR / "text_only" / "multiline.txt")
+
+
+@pytest.fixture(scope="session")
+def kind_lines() -> Tuple[str, ...]:
+    """Load kind detection fixture."""
+    return tuple(line.strip() for line in _load_lines(FIXTURE_DIR / "text_only" / "kinds.txt"))
+
+
+@pytest.fixture(scope="session")
+def caption_lines() -> Tuple[str, ...]:
+    """Load caption merge fixture."""
+    return _load_lines(FIXTURE_DIR / "text_only" / "caption_merge.txt")
+
+
+@pytest.fixture(scope="session")
+def system_lines() -> Tuple[str, ...]:
+    """Load system lines fixture."""
+    return _load_lines(FIXTURE_DIR / "text_only" / "system_lines.txt")
+
+
+@pytest.fixture(scope="session")
+def sample_24h_lines() -> Tuple[str, ...]:
+    """Load sample 24h format chat file."""
+    return _load_lines(FIXTURE_DIR / "text_only" / "sample_24h.txt")
+
+
+@pytest.fixture(scope="session")
+def sample_12h_lines() -> Tuple[str, ...]:
+    """Load sample 12h format chat file."""
+    return _load_lines(FIXTURE_DIR / "text_only" / "sample_12h.txt")
+
+
+@pytest.fixture(scope="session")
+def header_fmt(header_lines) -> dict:
+    """Detected timestamp format for the header cases fixture."""
+    return detect_datetime_format(header_lines)
+
+
+@pytest.fixture(scope="session")
+def multiline_fmt(multiline_lines) -> dict:
+    """Detected timestamp format for the multiline fixture."""
+    return detect_datetime_format(multiline_lines)
+
+
+@pytest.fixture(scope="session")
+def system_fmt(system_lines) -> dict:
+    """Detected timestamp format for the system lines fixture."""
+    return detect_datetime_format(system_lines)
+
+
+@pytest.fixture(scope="session")
+def sample_24h_fmt(sample_24h_lines) -> dict:
+    """Detected timestamp format for the 24h sample chat."""
+    return detect_datetime_format(sample_24h_lines)
+
+
+@pytest.fixture(scope="session")
+def sample_12h_fmt(sample_12h_lines) -> dict:
+    """Detected timestamp format for the 12h sample chat."""
+    return detect_datetime_format(sample_12h_lines)
+
 
 @pytest.fixture
 def pipeline_sample_root(tmp_path: Path) -> Path:
@@ -14,10 +165,61 @@ def pipeline_sample_root(tmp_path: Path) -> Path:
     return dst
 
 
+@pytest.fixture(scope="session")
+def pipeline_m1_artifact(tmp_path_factory) -> Path:
+    """messages.M1.jsonl for pipeline_small_chat, parsed once; pass as ``resume_from_m1``."""
+    path = tmp_path_factory.mktemp("pipeline_m1") / "messages.M1.jsonl"
+    write_messages_jsonl(ParserAgent(str(FIXTURE_DIR / "pipeline_small_chat")).parse(), path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def make_msg():
+    """Factory for test Messages; use ``Message(...)`` where validation is under test."""
+    return _copy_base_msg
+
+
+@pytest.fixture(scope="session")
+def cfg_with():
+    """Factory for AudioConfig built from a shared test baseline."""
+    return _cfg_with
+
+
+@pytest.fixture(scope="session")
+def touch_mtime():
+    """Helper that creates a small file with a given mtime (epoch seconds)."""
+    return _touch_mtime
+
+
+@pytest.fixture(scope="module")
+def memo_sha256():
+    """Share media hashes across tests; opt in per module via ``pytest.mark.usefixtures``."""
+    with pytest.MonkeyPatch.context() as mp:
+        for module in _SHA256_CALLERS:
+            mp.setattr(f"{module}.sha256_file", _memo_sha256_file)
+        yield
+
+
 @pytest.fixture
-def stub_transcriber(monkeypatch) -> List[int]:
-    """Patch AudioTranscriber with a deterministic stub and record calls."""
-    calls: List[int] = []
+def openai_key(monkeypatch) -> None:
+    """Set a dummy OPENAI_API_KEY; opt in per module via ``pytest.mark.usefixtures``."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+@pytest.fixture
+def transcriber(audio_config) -> AudioTranscriber:
+    """Build an AudioTranscriber from the requesting module's ``audio_config`` fixture."""
+    return AudioTranscriber(audio_config)
+
+
+@pytest.fixture
+def fast_duration(monkeypatch) -> None:
+    """Report every WAV as 1 second long instead of reading its header."""
+    monkeypatch.setattr(AudioTranscriber, "_wav_duration_seconds", lambda self, _path: 1.0)
+
+
+def _make_stub_transcriber(calls: List[int]) -> type:
+    """Deterministic AudioTranscriber stand-in that records voice idx values in ``calls``."""
 
     class StubTranscriber:
         pipeline_version = "stub-m3"
@@ -41,5 +243,117 @@ def stub_transcriber(monkeypatch) -> List[int]:
                 "cost": 0.001,
             }
 
-    monkeypatch.setattr("src.pipeline.runner.AudioTranscriber", StubTranscriber)
+    return StubTranscriber
+
+
+@pytest.fixture
+def stub_transcriber(monkeypatch) -> List[int]:
+    """Patch AudioTranscriber with a deterministic stub and record calls."""
+    calls: List[int] = []
+    monkeypatch.setattr("src.pipeline.runner.AudioTranscriber", _make_stub_transcriber(calls))
     return calls
+
+
+@pytest.fixture(scope="session")
+def sequential_pipeline_result(tmp_path_factory) -> dict:
+    """One stubbed max_workers_audio=1 run (real M1 parse) on a private pipeline_small_chat copy.
+
+    Returns ``root`` (reuse it for runs compared against this one), ``result``
+    from run_pipeline, and the stub transcriber ``calls``.
+    """
+    base = tmp_path_factory.mktemp("pipeline_seq")
+    root = base / "chat"
+    shutil.copytree(FIXTURE_DIR / "pipeline_small_chat", root)
+    calls: List[int] = []
+    cfg = PipelineConfig(
+        root=root,
+        run_dir=base / "run",
+        max_workers_audio=1,
+        resume=False,
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.pipeline.runner.AudioTranscriber", _make_stub_transcriber(calls))
+        result = run_pipeline(cfg)
+    return {"root": root, "result": result, "calls": calls}
+
+
+class SessionState(dict):
+    """Simple dict with attribute access to mimic Streamlit session state."""
+
+    def __getattr__(self, item):
+        return self[item]
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+
+def _make_mock_streamlit():
+    mock = MagicMock()
+    mock.set_page_config = MagicMock()
+    mock.title = MagicMock()
+    mock.session_state = SessionState()
+
+    def _columns(spec):
+        count = spec if isinstance(spec, int) else len(spec)
+
+        def _make_col():
+            col = MagicMock()
+            col.__enter__.return_value = None
+            col.__exit__.return_value = False
+            return col
+
+        return tuple(_make_col() for _ in range(count))
+
+    mock.columns.side_effect = _columns
+    mock.header = MagicMock()
+    mock.subheader = MagicMock()
+    mock.divider = MagicMock()
+    mock.metric = MagicMock()
+    mock.caption = MagicMock()
+    mock.table = MagicMock()
+    mock.text_area = MagicMock()
+    mock.json = MagicMock()
+    mock.info = MagicMock()
+    mock.warning = MagicMock()
+    mock.error = MagicMock()
+    mock.success = MagicMock()
+    mock.rerun = MagicMock()
+
+    class _Expander:
+        def __enter__(self):
+            return None
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    mock.expander.side_effect = lambda *args, **kwargs: _Expander()
+
+    mock.button.side_effect = lambda *a, **k: False
+    mock.text_input.side_effect = lambda label, value="", **k: value
+    def _selectbox(label, options, **kwargs):
+        opts = list(options) if not isinstance(options, list) else options
+        return opts[0] if opts else None
+
+    mock.selectbox.side_effect = _selectbox
+    mock.checkbox.side_effect = lambda *a, **k: False
+    mock.number_input.side_effect = lambda label, **k: k.get("min_value", 1)
+    def _slider(label, *args, **kwargs):
+        if "value" in kwargs:
+            return kwargs["value"]
+        if "min_value" in kwargs:
+            return kwargs["min_value"]
+        return 1
+
+    mock.slider.side_effect = _slider
+
+    return mock
+
+
+@pytest.fixture(scope="module")
+def patched_streamlit():
+    """Mocked ``streamlit`` in sys.modules (autorun disabled) for the requesting module."""
+    mock_st = _make_mock_streamlit()
+    with patch.dict(os.environ, {"STREAMLIT_DISABLE_AUTORUN": "1"}), patch.dict(
+        sys.modules, {"streamlit": mock_st}
+    ):
+        yield mock_st
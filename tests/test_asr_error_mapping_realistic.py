@@ -7,25 +7,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.audio_transcriber import AudioConfig, AudioTranscriber
-from src.schema.message import Message
+from src.audio_transcriber import AudioTranscriber
 from src.utils.asr import AsrChunkResult
 
 
-def make_message(**kwargs):
-    """Create a Message with required fields filled in."""
-    defaults = {
-        "idx": 0,
-        "ts": "2025-01-01T00:00:00",
-        "sender": "Test",
-        "kind": "text",
-        "content_text": "",
-        "derived": {},
-    }
-    defaults.update(kwargs)
-    return Message(**defaults)
-
-
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
@@ -51,10 +36,10 @@ def multi_chunk_wav(temp_dir):
 
 
 @pytest.fixture
-def audio_config(temp_dir):
+def audio_config(temp_dir, cfg_with):
     """Create an AudioConfig with test-friendly settings."""
-    return AudioConfig(
-        cache_dir=temp_dir / "cache",
+    return cfg_with(
+        temp_dir / "cache",
         chunk_seconds=1.0,  # Small chunks for testing
         chunk_overlap_seconds=0.0,  # No overlap for predictable chunk count
     )
@@ -78,7 +63,7 @@ def create_mock_asr_result(status, text="", error=None, error_kind=None):
 class TestMixedSuccessAndTimeout:
     """Tests for mixed success and timeout scenarios."""
 
-    def test_some_chunks_succeed_last_times_out(self, multi_chunk_wav, audio_config, monkeypatch):
+    def test_some_chunks_succeed_last_times_out(self, multi_chunk_wav, audio_config, monkeypatch, make_msg):
         """Verify partial status when some chunks succeed but last times out."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         transcriber = AudioTranscriber(audio_config)
@@ -99,7 +84,7 @@ class TestMixedSuccessAndTimeout:
 
         transcriber.asr_client.transcribe_chunk = mock_transcribe
 
-        m = make_message(
+        m = make_msg(
             kind="voice",
             media_filename=str(multi_chunk_wav),
         )
@@ -111,7 +96,7 @@ class TestMixedSuccessAndTimeout:
         assert m.status_reason is not None
         assert m.status_reason.code == "asr_partial"
 
-    def test_first_chunk_succeeds_rest_fail(self, multi_chunk_wav, audio_config, monkeypatch):
+    def test_first_chunk_succeeds_rest_fail(self, multi_chunk_wav, audio_config, monkeypatch, make_msg):
         """Verify partial status when first chunk succeeds but rest fail."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         transcriber = AudioTranscriber(audio_config)
@@ -131,7 +116,7 @@ class TestMixedSuccessAndTimeout:
 
         transcriber.asr_client.transcribe_chunk = mock_transcribe
 
-        m = make_message(
+        m = make_msg(
             kind="voice",
             media_filename=str(multi_chunk_wav),
         )
@@ -145,7 +130,7 @@ class TestMixedSuccessAndTimeout:
 class TestAllChunksFail:
     """Tests for all chunks failing scenarios."""
 
-    def test_all_chunks_timeout_maps_to_timeout_asr(self, multi_chunk_wav, audio_config, monkeypatch):
+    def test_all_chunks_timeout_maps_to_timeout_asr(self, multi_chunk_wav, audio_config, monkeypatch, make_msg):
         """Verify timeout_asr status reason when all chunks timeout."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         transcriber = AudioTranscriber(audio_config)
@@ -159,7 +144,7 @@ class TestAllChunksFail:
 
         transcriber.asr_client.transcribe_chunk = mock_transcribe
 
-        m = make_message(
+        m = make_msg(
             kind="voice",
             media_filename=str(multi_chunk_wav),
         )
@@ -171,7 +156,7 @@ class TestAllChunksFail:
         assert m.status_reason is not None
         assert m.status_reason.code == "timeout_asr"
 
-    def test_all_chunks_auth_error_maps_to_asr_failed(self, multi_chunk_wav, audio_config, monkeypatch):
+    def test_all_chunks_auth_error_maps_to_asr_failed(self, multi_chunk_wav, audio_config, monkeypatch, make_msg):
         """Verify asr_failed status reason when all chunks have auth errors."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         transcriber = AudioTranscriber(audio_config)
@@ -185,7 +170,7 @@ class TestAllChunksFail:
 
         transcriber.asr_client.transcribe_chunk = mock_transcribe
 
-        m = make_message(
+        m = make_msg(
             kind="voice",
             media_filename=str(multi_chunk_wav),
         )
@@ -195,7 +180,7 @@ class TestAllChunksFail:
         assert m.status == "failed"
         assert m.status_reason.code == "asr_failed"
 
-    def test_all_chunks_quota_error(self, multi_chunk_wav, audio_config, monkeypatch):
+    def test_all_chunks_quota_error(self, multi_chunk_wav, audio_config, monkeypatch, make_msg):
         """Verify asr_failed status reason when quota exceeded."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         transcriber = AudioTranscriber(audio_config)
@@ -209,7 +194,7 @@ class TestAllChunksFail:
 
         transcriber.asr_client.transcribe_chunk = mock_transcribe
 
-        m = make_message(
+        m = make_msg(
             kind="voice",
             media_filename=str(multi_chunk_wav),
         )
@@ -223,7 +208,7 @@ class TestAllChunksFail:
 class TestErrorSummaryContents:
     """Tests for error_summary field contents."""
 
-    def test_error_summary_counts_correct(self, multi_chunk_wav, audio_config, monkeypatch):
+    def test_error_summary_counts_correct(self, multi_chunk_wav, audio_config, monkeypatch, make_msg):
         """Verify error_summary has correct chunk counts."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         transcriber = AudioTranscriber(audio_config)
@@ -243,7 +228,7 @@ class TestErrorSummaryContents:
 
         transcriber.asr_client.transcribe_chunk = mock_transcribe
 
-        m = make_message(
+        m = make_msg(
             kind="voice",
             media_filename=str(multi_chunk_wav),
         )
@@ -254,7 +239,7 @@ class TestErrorSummaryContents:
         assert error_summary["chunks_ok"] == 2
         assert error_summary["chunks_error"] > 0
 
-    def test_error_summary_last_error_kind_correct(self, multi_chunk_wav, audio_config, monkeypatch):
+    def test_error_summary_last_error_kind_correct(self, multi_chunk_wav, audio_config, monkeypatch, make_msg):
         """Verify last_error_kind is correctly captured."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         transcriber = AudioTranscriber(audio_config)
@@ -273,7 +258,7 @@ class TestErrorSummaryContents:
 
         transcriber.asr_client.transcribe_chunk = mock_transcribe
 
-        m = make_message(
+        m = make_msg(
             kind="voice",
             media_filename=str(multi_chunk_wav),
         )
@@ -287,7 +272,7 @@ class TestErrorSummaryContents:
 class TestPlaceholderText:
     """Tests for placeholder text on failures."""
 
-    def test_failed_transcription_has_placeholder(self, multi_chunk_wav, audio_config, monkeypatch):
+    def test_failed_transcription_has_placeholder(self, multi_chunk_wav, audio_config, monkeypatch, make_msg):
         """Verify placeholder text is set when transcription fails."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         transcriber = AudioTranscriber(audio_config)
@@ -301,7 +286,7 @@ class TestPlaceholderText:
 
         transcriber.asr_client.transcribe_chunk = mock_transcribe
 
-        m = make_message(
+        m = make_msg(
             kind="voice",
             media_filename=str(multi_chunk_wav),
         )
@@ -310,7 +295,7 @@ class TestPlaceholderText:
 
         assert "[AUDIO TRANSCRIPTION FAILED]" in m.content_text
 
-    def test_partial_transcription_has_content(self, multi_chunk_wav, audio_config, monkeypatch):
+    def test_partial_transcription_has_content(self, multi_chunk_wav, audio_config, monkeypatch, make_msg):
         """Verify partial transcription preserves successful content."""
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         transcriber = AudioTranscriber(audio_config)
@@ -326,7 +311,7 @@ class TestPlaceholderText:
 
         transcriber.asr_client.transcribe_chunk = mock_transcribe
 
-        m = make_message(
+        m = make_msg(
             kind="voice",
             media_filename=str(multi_chunk_wav),
         )
@@ -6,22 +6,9 @@ from pathlib import Path
 
 import pytest
 
-from src.audio_transcriber import AudioConfig, AudioTranscriber, ChunkingError
-from src.schema.message import Message
+from src.audio_transcriber import AudioTranscriber, ChunkingError
 
-
-def make_message(**kwargs):
-    """Create a Message with required fields filled in."""
-    defaults = {
-        "idx": 0,
-        "ts": "2025-01-01T00:00:00",
-        "sender": "Test",
-        "kind": "text",
-        "content_text": "",
-        "derived": {},
-    }
-    defaults.update(kwargs)
-    return Message(**defaults)
+pytestmark = pytest.mark.usefixtures("openai_key")
 
 
 @pytest.fixture
@@ -31,10 +18,8 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def valid_wav_file(temp_dir):
-    """Create a valid WAV file with 1 second of audio."""
-    wav_path = temp_dir / "valid.wav"
+def _write_valid_wav(wav_path: Path) -> Path:
+    """Write a valid WAV file with 1 second of audio."""
     sample_rate = 16000
     duration_sec = 1.0
     n_frames = int(sample_rate * duration_sec)
@@ -50,10 +35,13 @@ def valid_wav_file(temp_dir):
 
 
 @pytest.fixture
-def zero_length_wav(temp_dir):
-    """Create a 0-length WAV file."""
-    wav_path = temp_dir / "zero_length.wav"
+def valid_wav_file(temp_dir):
+    """Create a valid WAV file with 1 second of audio."""
+    return _write_valid_wav(temp_dir / "valid.wav")
+
 
+def _write_zero_length_wav(wav_path: Path) -> Path:
+    """Write a WAV file with a valid header and no frames."""
     with wave.open(str(wav_path), "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
@@ -65,58 +53,57 @@ def zero_length_wav(temp_dir):
 
 
 @pytest.fixture
-def audio_config(temp_dir):
+def zero_length_wav(temp_dir):
+    """Create a 0-length WAV file."""
+    return _write_zero_length_wav(temp_dir / "zero_length.wav")
+
+
+@pytest.fixture
+def audio_config(temp_dir, cfg_with):
     """Create an AudioConfig with test-friendly settings."""
-    return AudioConfig(
-        cache_dir=temp_dir / "cache",
-        chunk_seconds=10.0,
-        chunk_overlap_seconds=0.25,
-    )
+    return cfg_with(temp_dir / "cache")
+
+
+@pytest.fixture(scope="module")
+def failed_msg(tmp_path_factory, make_msg, cfg_with):
+    """Transcribe a 0-length WAV once and share the resulting message across the module."""
+    base_dir = tmp_path_factory.mktemp("zero_length")
+    wav_path = _write_zero_length_wav(base_dir / "zero_length.wav")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENAI_API_KEY", "test-key")
+        transcriber = AudioTranscriber(cfg_with(base_dir / "cache"))
+        m = make_msg(
+            kind="voice",
+            media_filename=str(wav_path),
+        )
+        transcriber.transcribe(m)
+
+    return m
 
 
 class TestChunkingFailureSetsFailedStatus:
     """Tests for test_chunking_failure_sets_failed_status."""
 
-    def test_zero_length_wav_raises_chunking_error(self, zero_length_wav, audio_config, monkeypatch):
+    def test_zero_length_wav_raises_chunking_error(self, zero_length_wav, transcriber):
         """Verify 0-length WAV raises ChunkingError."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
         with pytest.raises(ChunkingError) as exc_info:
             transcriber._chunk_wav(zero_length_wav, 0.0)
 
         assert "Invalid audio duration" in str(exc_info.value)
 
-    def test_zero_length_transcribe_sets_failed_status(self, zero_length_wav, audio_config, monkeypatch):
+    def test_zero_length_transcribe_sets_failed_status(self, failed_msg):
         """Verify transcribe sets failed status for 0-length WAV."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
-        m = make_message(
-            kind="voice",
-            media_filename=str(zero_length_wav),
-        )
-
-        transcriber.transcribe(m)
+        m = failed_msg
 
         assert m.status == "failed"
         assert m.status_reason is not None
         assert m.status_reason.code == "asr_failed"
         assert "[AUDIO TRANSCRIPTION FAILED" in m.content_text
 
-    def test_chunking_failure_sets_error_summary(self, zero_length_wav, audio_config, monkeypatch):
+    def test_chunking_failure_sets_error_summary(self, failed_msg):
         """Verify error_summary is set for chunking failures."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
-        m = make_message(
-            kind="voice",
-            media_filename=str(zero_length_wav),
-        )
-
-        transcriber.transcribe(m)
-
-        asr_info = m.derived.get("asr", {})
+        asr_info = failed_msg.derived.get("asr", {})
         error_summary = asr_info.get("error_summary", {})
 
         assert error_summary["chunks_ok"] == 0
@@ -125,30 +112,34 @@ class TestChunkingFailureSetsFailedStatus:
         assert error_summary["last_error_message"] is not None
 
 
+@pytest.fixture(scope="class")
+def valid_wav_chunks(tmp_path_factory, cfg_with):
+    """Chunk a valid 1s WAV once per class; returns ``(duration, chunks)``."""
+    base_dir = tmp_path_factory.mktemp("valid_chunks")
+    wav_path = _write_valid_wav(base_dir / "valid.wav")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENAI_API_KEY", "test-key")
+        transcriber = AudioTranscriber(cfg_with(base_dir / "cache"))
+        duration = transcriber._wav_duration_seconds(wav_path)
+        chunks = transcriber._chunk_wav(wav_path, duration)
+
+    return duration, chunks
+
+
 class TestChunkManifestNonEmptyForValidAudio:
     """Tests for test_chunk_manifest_non_empty_for_valid_audio."""
 
-    def test_valid_audio_produces_chunks(self, valid_wav_file, audio_config, monkeypatch):
+    def test_valid_audio_produces_chunks(self, valid_wav_chunks):
         """Verify valid audio produces non-empty chunk list."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
+        duration, chunks = valid_wav_chunks
 
-        # Get duration
-        duration = transcriber._wav_duration_seconds(valid_wav_file)
         assert duration > 0
-
-        # Chunk should succeed
-        chunks = transcriber._chunk_wav(valid_wav_file, duration)
-
         assert len(chunks) > 0
 
-    def test_chunks_have_increasing_timestamps(self, valid_wav_file, audio_config, monkeypatch):
+    def test_chunks_have_increasing_timestamps(self, valid_wav_chunks):
         """Verify chunks have strictly increasing timestamps."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
-        duration = transcriber._wav_duration_seconds(valid_wav_file)
-        chunks = transcriber._chunk_wav(valid_wav_file, duration)
+        _, chunks = valid_wav_chunks
 
         prev_start = -1.0
         for chunk in chunks:
@@ -156,13 +147,9 @@ class TestChunkManifestNonEmptyForValidAudio:
             assert chunk["end_sec"] > chunk["start_sec"]
             prev_start = chunk["start_sec"]
 
-    def test_chunk_paths_exist(self, valid_wav_file, audio_config, monkeypatch):
+    def test_chunk_paths_exist(self, valid_wav_chunks):
         """Verify chunk WAV files are actually created."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
-        duration = transcriber._wav_duration_seconds(valid_wav_file)
-        chunks = transcriber._chunk_wav(valid_wav_file, duration)
+        _, chunks = valid_wav_chunks
 
         for chunk in chunks:
             chunk_path = Path(chunk["wav_chunk_path"])
@@ -172,11 +159,8 @@ class TestChunkManifestNonEmptyForValidAudio:
 class TestAsrChunkingErrorSetsErrorSummary:
     """Tests for test_asr_chunking_error_sets_error_summary."""
 
-    def test_missing_wav_raises_chunking_error(self, audio_config, temp_dir, monkeypatch):
+    def test_missing_wav_raises_chunking_error(self, temp_dir, transcriber):
         """Verify missing WAV file raises ChunkingError."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
         missing_path = temp_dir / "does_not_exist.wav"
 
         with pytest.raises(ChunkingError) as exc_info:
@@ -184,29 +168,16 @@ class TestAsrChunkingErrorSetsErrorSummary:
 
         assert "not found" in str(exc_info.value)
 
-    def test_negative_duration_raises_chunking_error(self, valid_wav_file, audio_config, monkeypatch):
+    def test_negative_duration_raises_chunking_error(self, valid_wav_file, transcriber):
         """Verify negative duration raises ChunkingError."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
         with pytest.raises(ChunkingError) as exc_info:
             transcriber._chunk_wav(valid_wav_file, -1.0)
 
         assert "Invalid audio duration" in str(exc_info.value)
 
-    def test_derived_asr_always_has_required_fields(self, zero_length_wav, audio_config, monkeypatch):
+    def test_derived_asr_always_has_required_fields(self, failed_msg):
         """Verify derived['asr'] has required fields even on failure."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
-        m = make_message(
-            kind="voice",
-            media_filename=str(zero_length_wav),
-        )
-
-        transcriber.transcribe(m)
-
-        asr_info = m.derived.get("asr", {})
+        asr_info = failed_msg.derived.get("asr", {})
 
         # Required fields should be present
         assert "total_duration_seconds" in asr_info
@@ -218,11 +189,8 @@ class TestAsrChunkingErrorSetsErrorSummary:
 class TestEdgeCases:
     """Additional edge case tests."""
 
-    def test_truncated_wav_header(self, temp_dir, audio_config, monkeypatch):
+    def test_truncated_wav_header(self, temp_dir, transcriber):
         """Verify truncated WAV file raises ChunkingError."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
         # Create a truncated WAV (just RIFF header, no data)
         truncated_path = temp_dir / "truncated.wav"
         truncated_path.write_bytes(b"RIFF\x00\x00\x00\x00WAVEfmt ")
@@ -230,12 +198,9 @@ class TestEdgeCases:
         with pytest.raises(ChunkingError):
             transcriber._chunk_wav(truncated_path, 1.0)
 
-    def test_non_voice_message_skipped(self, valid_wav_file, audio_config, monkeypatch):
+    def test_non_voice_message_skipped(self, valid_wav_file, transcriber, make_msg):
         """Verify non-voice messages are skipped without error."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        transcriber = AudioTranscriber(audio_config)
-
-        m = make_message(
+        m = make_msg(
             kind="text",
             media_filename=str(valid_wav_file),
             content_text="Hello",
@@ -1,9 +1,10 @@
 """Tests for AudioTranscriber pipeline."""
 
 from pathlib import Path
-import shutil
 import wave
 import subprocess
+from unittest.mock import MagicMock
+
 import pytest
 
 from src.audio_transcriber import AudioConfig, AudioTranscriber
@@ -11,12 +12,11 @@ from src.schema.message import Message
 from src.utils.vad import run_vad, VadStats
 
 
-def test_audio_transcriber_smoke_imports(tmp_path):
-    cfg = AudioConfig()
-    transcriber = AudioTranscriber(cfg)
-    msg = Message(idx=0, ts="2025-01-01T00:00:00", sender="Alice", kind="voice")
-    transcriber.transcribe(msg)
-    assert "asr" in msg.derived
+def test_audio_transcriber_smoke_imports():
+    from src import audio_transcriber
+
+    assert hasattr(audio_transcriber, "AudioTranscriber")
+    assert hasattr(audio_transcriber, "AudioConfig")
 
 
 def test_audio_transcriber_sets_empty_derived_asr():
@@ -24,8 +24,8 @@ def test_audio_transcriber_sets_empty_derived_asr():
     msg = Message(idx=0, ts="2025-01-01T00:00:00", sender="Alice", kind="voice")
     transcriber.transcribe(msg)
 
-    asr = msg.derived.get("asr")
-    assert asr is not None
+    assert "asr" in msg.derived
+    asr = msg.derived["asr"]
     assert asr["pipeline_version"] == transcriber.pipeline_version
     # ensure config snapshot includes defaults
     assert asr["config_snapshot"]["sample_rate"] == 16000
@@ -121,13 +121,11 @@ def _make_wav(path: Path, seconds: float, sample_rate: int = 16000):
         wf.writeframes(b"\x01\x02" * n_frames)
 
 
-def test_chunking_respects_length_and_overlap(tmp_path, monkeypatch):
+def test_chunking_respects_length_and_overlap(tmp_path, monkeypatch, cfg_with):
     wav_path = tmp_path / "speech.wav"
     _make_wav(wav_path, seconds=5)
 
-    cfg = AudioConfig(chunk_seconds=2.5, chunk_overlap_seconds=0.25, cache_dir=tmp_path / "cache")
-    if cfg.cache_dir.exists():
-        shutil.rmtree(cfg.cache_dir)
+    cfg = cfg_with(tmp_path / "cache", chunk_seconds=2.5)
     transcriber = AudioTranscriber(cfg)
     monkeypatch.setattr(transcriber, "_to_wav", lambda m: wav_path)
 
@@ -142,11 +140,12 @@ def test_chunking_respects_length_and_overlap(tmp_path, monkeypatch):
     assert chunks[2]["end_sec"] == pytest.approx(5.0, rel=0, abs=0.01)
 
 
-def test_asr_partial_status_when_chunk_errors(tmp_path, monkeypatch):
+def test_asr_partial_status_when_chunk_errors(tmp_path, monkeypatch, cfg_with):
     wav_path = tmp_path / "speech.wav"
     _make_wav(wav_path, seconds=3)
 
-    cfg = AudioConfig(chunk_seconds=2.0, chunk_overlap_seconds=0.0, cache_dir=tmp_path / "cache")
+    # Private cache: partial results are cached and must not reach other tests.
+    cfg = cfg_with(tmp_path / "cache", chunk_seconds=2.0, chunk_overlap_seconds=0.0)
     transcriber = AudioTranscriber(cfg)
     monkeypatch.setattr(transcriber, "_to_wav", lambda m: wav_path)
 
@@ -164,7 +163,7 @@ def test_asr_partial_status_when_chunk_errors(tmp_path, monkeypatch):
     assert msg.status == "partial"
     assert msg.status_reason.code == "asr_partial"
 
-def test_config_snapshot_paths_are_strings(tmp_path, monkeypatch):
+def test_config_snapshot_paths_are_strings(tmp_path, monkeypatch, fast_duration):
     wav_path = tmp_path / "speech.wav"
     _make_wav(wav_path, seconds=1)
 
@@ -180,7 +179,7 @@ def test_config_snapshot_paths_are_strings(tmp_path, monkeypatch):
     assert snapshot["cache_dir"].endswith("cache")
 
 
-def test_cache_write_and_read_roundtrip(tmp_path, monkeypatch):
+def test_cache_write_and_read_roundtrip(tmp_path, monkeypatch, fast_duration):
     wav_path = tmp_path / "speech.wav"
     _make_wav(wav_path, seconds=1)
 
@@ -193,8 +192,15 @@ def test_cache_write_and_read_roundtrip(tmp_path, monkeypatch):
     cache_files = list(cfg.cache_dir.glob("*.json"))
     assert cache_files, "cache file should be written"
 
-    # Re-run; should load from cache and not modify transcript
+    # Re-run; should load from cache without touching ASR or modifying the transcript
+    asr_spy = MagicMock(wraps=transcriber.asr_client.transcribe_chunk)
+    monkeypatch.setattr(transcriber.asr_client, "transcribe_chunk", asr_spy)
+    to_wav_spy = MagicMock(wraps=transcriber._to_wav)
+    monkeypatch.setattr(transcriber, "_to_wav", to_wav_spy)
+
     msg2 = Message(idx=1, ts="2025-01-01T00:00:00", sender="Bob", kind="voice", media_filename=str(wav_path))
     transcriber.transcribe(msg2)
+    assert asr_spy.call_count == 0
+    assert to_wav_spy.call_count == 0
     assert msg2.content_text == msg.content_text
     assert msg2.derived["asr"]["chunks"] == msg.derived["asr"]["chunks"]
@@ -5,29 +5,12 @@ from src.pipeline.manifest import build_manifest, write_manifest
 from src.pipeline.metrics import compute_metrics, write_metrics
 from src.pipeline.materialize import materialize_run
 from src.pipeline.validation import validate_jsonl, SchemaValidationError
-from src.schema.message import Message
 
 
-def _make_msg(idx: int, kind: str, status: str = "ok") -> Message:
-    return Message(
-        idx=idx,
-        ts="2025-01-01T00:00:00",
-        sender="Alice",
-        kind=kind,
-        content_text="",
-        raw_line="",
-        raw_block="",
-        media_hint=None,
-        media_filename=None,
-        caption=None,
-        status=status,
-    )
-
-
-def test_manifest_and_metrics_roundtrip(tmp_path):
-    m1 = [_make_msg(0, "text"), _make_msg(1, "voice")]
+def test_manifest_and_metrics_roundtrip(tmp_path, make_msg):
+    m1 = [make_msg(idx=0, kind="text"), make_msg(idx=1, kind="voice")]
     m2 = m1
-    m3 = [_make_msg(0, "text"), _make_msg(1, "voice", status="partial")]
+    m3 = [make_msg(idx=0, kind="text"), make_msg(idx=1, kind="voice", status="partial")]
 
     inputs = {"messages_m1": "m1.jsonl", "messages_m2": "m2.jsonl", "messages_m3": "m3.jsonl"}
     outputs = {"chat_with_audio": "chat.txt", "preview_transcripts": None, "manifest": "manifest.json", "metrics": "metrics.json"}
@@ -47,10 +30,10 @@ def test_manifest_and_metrics_roundtrip(tmp_path):
     assert loaded_metrics["voice_total"] == 1
 
 
-def test_materialize_run_writes_outputs(tmp_path):
+def test_materialize_run_writes_outputs(tmp_path, make_msg):
     msgs = [
-        _make_msg(0, "text"),
-        _make_msg(1, "voice"),
+        make_msg(idx=0, kind="text"),
+        make_msg(idx=1, kind="voice"),
     ]
     run_dir = tmp_path / "run"
     summary = materialize_run("run-2", run_dir, msgs, msgs, msgs)
@@ -6,6 +6,8 @@ import pytest
 from src.audio_transcriber import AudioConfig, AudioTranscriber
 from src.schema.message import Message
 
+pytestmark = pytest.mark.usefixtures("openai_key")
+
 
 def _make_wav(path: Path, seconds: float = 1.0, sample_rate: int = 16000) -> None:
     frame_count = int(seconds * sample_rate)
@@ -16,22 +18,22 @@ def _make_wav(path: Path, seconds: float = 1.0, sample_rate: int = 16000) -> Non
         wf.writeframes(b"\x00\x00" * frame_count)
 
 
-def test_derived_asr_provider_model(monkeypatch, tmp_path):
-    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-    wav_path = tmp_path / "voice.wav"
-    _make_wav(wav_path)
-
-    cfg = AudioConfig(
+@pytest.fixture
+def audio_config(tmp_path):
+    return AudioConfig(
         cache_dir=tmp_path / "cache",
         chunk_dir=tmp_path / "chunks",
         asr_provider="whisper_openai",
         asr_language="en",
     )
-    transcriber = AudioTranscriber(cfg)
+
+
+def test_derived_asr_provider_model(monkeypatch, tmp_path, transcriber, fast_duration):
+    wav_path = tmp_path / "voice.wav"
+    _make_wav(wav_path)
 
     # Avoid ffmpeg by stubbing conversion + chunking.
     monkeypatch.setattr(AudioTranscriber, "_to_wav", lambda self, m: wav_path)
-    monkeypatch.setattr(AudioTranscriber, "_wav_duration_seconds", lambda self, _: 1.0)
     monkeypatch.setattr(
         AudioTranscriber,
         "_chunk_wav",
@@ -13,14 +13,11 @@ from src.pipeline.runner import run_pipeline
 from src.pipeline.manifest import load_manifest, validate_manifest
 from src.pipeline.metrics import validate_metrics
 
-
-@pytest.fixture
-def repo_root() -> Path:
-    """Get repository root directory."""
-    return Path(__file__).resolve().parents[1]
+# Keep the shared pipeline run on one xdist worker (--dist=loadgroup).
+pytestmark = pytest.mark.xdist_group("pipeline_small_chat")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixture_dir(repo_root: Path) -> Path:
     """Get pipeline_small_chat fixture directory."""
     return repo_root / "tests" / "fixtures" / "pipeline_small_chat"
@@ -38,6 +35,30 @@ def expected_metrics_path(fixture_dir: Path) -> Path:
     return fixture_dir / "expected_metrics.json"
 
 
+@pytest.fixture(scope="session")
+def small_chat_pipeline_run(
+    fixture_dir: Path, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Run the pipeline once on pipeline_small_chat; returns (manifest, metrics) dicts."""
+    cfg = PipelineConfig(
+        root=fixture_dir,
+        chat_file=fixture_dir / "_chat.txt",
+        run_dir=tmp_path_factory.mktemp("small_chat") / "run",
+        sample_limit=10,  # Small sample for faster test
+        resume=False,
+    )
+
+    run_pipeline(cfg)
+
+    assert cfg.manifest_path.exists(), "Pipeline should create manifest"
+    assert cfg.metrics_path.exists(), "Pipeline should create metrics"
+
+    return (
+        json.loads(cfg.manifest_path.read_text(encoding="utf-8")),
+        json.loads(cfg.metrics_path.read_text(encoding="utf-8")),
+    )
+
+
 def normalize_manifest(data: dict[str, Any]) -> dict[str, Any]:
     """Normalize volatile fields in manifest for comparison.
 
@@ -120,29 +141,14 @@ class TestManifestGolden:
     @pytest.mark.slow
     @pytest.mark.integration
     def test_pipeline_output_matches_golden_manifest(
-        self, fixture_dir: Path, expected_manifest_path: Path, tmp_path: Path
+        self, expected_manifest_path: Path, small_chat_pipeline_run: tuple[dict, dict]
     ) -> None:
-        """Run pipeline and compare manifest to golden (ignoring volatile fields)."""
+        """Compare the pipeline manifest to golden (ignoring volatile fields)."""
         # Skip if golden doesn't exist yet
         if not expected_manifest_path.exists():
             pytest.skip("Golden manifest not yet generated")
 
-        # Run pipeline on fixture
-        cfg = PipelineConfig(
-            root=fixture_dir,
-            chat_file=fixture_dir / "_chat.txt",
-            output_dir=tmp_path,
-            sample_limit=10,  # Small sample for faster test
-            resume=False,
-        )
-
-        run_pipeline(cfg)
-
-        # Load actual manifest
-        actual_manifest_path = cfg.run_dir / "run_manifest.json"
-        assert actual_manifest_path.exists(), "Pipeline should create manifest"
-
-        actual_data = json.loads(actual_manifest_path.read_text(encoding="utf-8"))
+        actual_data, _ = small_chat_pipeline_run
         golden_data = json.loads(expected_manifest_path.read_text(encoding="utf-8"))
 
         # Normalize both
@@ -194,29 +200,14 @@ class TestMetricsGolden:
     @pytest.mark.slow
     @pytest.mark.integration
     def test_pipeline_output_matches_golden_metrics(
-        self, fixture_dir: Path, expected_metrics_path: Path, tmp_path: Path
+        self, expected_metrics_path: Path, small_chat_pipeline_run: tuple[dict, dict]
     ) -> None:
-        """Run pipeline and compare metrics to golden (ignoring volatile fields)."""
+        """Compare the pipeline metrics to golden (ignoring volatile fields)."""
         # Skip if golden doesn't exist yet
         if not expected_metrics_path.exists():
             pytest.skip("Golden metrics not yet generated")
 
-        # Run pipeline on fixture
-        cfg = PipelineConfig(
-            root=fixture_dir,
-            chat_file=fixture_dir / "_chat.txt",
-            output_dir=tmp_path,
-            sample_limit=10,  # Small sample for faster test
-            resume=False,
-        )
-
-        run_pipeline(cfg)
-
-        # Load actual metrics
-        actual_metrics_path = cfg.run_dir / "metrics.json"
-        assert actual_metrics_path.exists(), "Pipeline should create metrics"
-
-        actual_data = json.loads(actual_metrics_path.read_text(encoding="utf-8"))
+        _, actual_data = small_chat_pipeline_run
         golden_data = json.loads(expected_metrics_path.read_text(encoding="utf-8"))
 
         # Normalize both
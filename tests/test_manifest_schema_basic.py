@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import copy
 import json
 from pathlib import Path
+from typing import Any, Callable
 
+import jsonschema
 import pytest
 
 from src.pipeline.manifest import (
@@ -14,25 +17,58 @@ from src.pipeline.manifest import (
     validate_manifest,
 )
 
-
-@pytest.fixture
-def repo_root() -> Path:
-    """Get repository root directory."""
-    return Path(__file__).resolve().parents[1]
-
-
-@pytest.fixture
+_BASE_MANIFEST = {
+    "schema_version": MANIFEST_SCHEMA_VERSION,
+    "run_id": "test-run-001",
+    "root": "/path/to/root",
+    "chat_file": "/path/to/chat.txt",
+    "run_dir": "/path/to/run",
+    "start_time": "2024-11-20T10:00:00Z",
+    "end_time": None,
+    "steps": {},
+    "summary": {
+        "messages_total": 100,
+        "voice_total": 10,
+        "error": None,
+    },
+}
+
+_BASE_STEP = {
+    "name": "M1_parse",
+    "status": "ok",
+    "total": 100,
+    "done": 50,
+    "error": None,
+    "started_at": None,
+    "ended_at": None,
+}
+
+
+@pytest.fixture(scope="session")
 def manifest_schema_path(repo_root: Path) -> Path:
     """Get path to manifest schema file."""
     return repo_root / "schema" / "run_manifest.schema.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def manifest_schema(manifest_schema_path: Path) -> dict:
     """Load manifest schema."""
     return json.loads(manifest_schema_path.read_text(encoding="utf-8"))
 
 
+def _keep_only_ids(manifest: dict) -> None:
+    """Drop every field except schema_version/run_id (root, chat_file, ... go missing)."""
+    for key in list(manifest):
+        if key not in ("schema_version", "run_id"):
+            del manifest[key]
+
+
+@pytest.fixture(scope="module")
+def base_manifest() -> dict:
+    """Valid manifest with one step; tests deep-copy it before mutating."""
+    return {**_BASE_MANIFEST, "steps": {"M1_parse": dict(_BASE_STEP)}}
+
+
 class TestManifestSchemaExists:
     """Test that the manifest schema file exists and is valid JSON."""
 
@@ -87,89 +123,27 @@ class TestManifestValidation:
         # Should not raise
         validate_manifest(manifest.to_dict())
 
-    def test_missing_required_field_fails(self) -> None:
-        """Manifest missing required field should fail validation."""
-        invalid_manifest = {
-            "schema_version": MANIFEST_SCHEMA_VERSION,
-            "run_id": "test-run-001",
-            # missing required fields like root, chat_file, etc.
-        }
-
-        with pytest.raises(Exception):  # jsonschema.ValidationError
-            validate_manifest(invalid_manifest)
-
-    def test_invalid_step_status_fails(self) -> None:
-        """Manifest with invalid step status should fail validation."""
-        invalid_manifest = {
-            "schema_version": MANIFEST_SCHEMA_VERSION,
-            "run_id": "test-run-001",
-            "root": "/path/to/root",
-            "chat_file": "/path/to/chat.txt",
-            "run_dir": "/path/to/run",
-            "start_time": "2024-11-20T10:00:00Z",
-            "end_time": None,
-            "steps": {
-                "M1_parse": {
-                    "name": "M1_parse",
-                    "status": "invalid_status",  # Not in enum
-                    "total": 100,
-                    "done": 100,
-                    "error": None,
-                    "started_at": None,
-                    "ended_at": None,
-                }
-            },
-            "summary": {
-                "messages_total": 100,
-                "voice_total": 10,
-                "error": None,
-            },
-        }
-
-        with pytest.raises(Exception):  # jsonschema.ValidationError
-            validate_manifest(invalid_manifest)
-
-    def test_negative_counts_fail(self) -> None:
-        """Manifest with negative counts should fail validation."""
-        invalid_manifest = {
-            "schema_version": MANIFEST_SCHEMA_VERSION,
-            "run_id": "test-run-001",
-            "root": "/path/to/root",
-            "chat_file": "/path/to/chat.txt",
-            "run_dir": "/path/to/run",
-            "start_time": "2024-11-20T10:00:00Z",
-            "end_time": None,
-            "steps": {},
-            "summary": {
-                "messages_total": -1,  # Negative count
-                "voice_total": 10,
-                "error": None,
-            },
-        }
-
-        with pytest.raises(Exception):  # jsonschema.ValidationError
-            validate_manifest(invalid_manifest)
-
-    def test_invalid_schema_version_format_fails(self) -> None:
-        """Manifest with invalid schema_version format should fail validation."""
-        invalid_manifest = {
-            "schema_version": "not-semver",  # Invalid semver format
-            "run_id": "test-run-001",
-            "root": "/path/to/root",
-            "chat_file": "/path/to/chat.txt",
-            "run_dir": "/path/to/run",
-            "start_time": "2024-11-20T10:00:00Z",
-            "end_time": None,
-            "steps": {},
-            "summary": {
-                "messages_total": 100,
-                "voice_total": 10,
-                "error": None,
-            },
-        }
-
-        with pytest.raises(Exception):  # jsonschema.ValidationError
-            validate_manifest(invalid_manifest)
+    @pytest.mark.parametrize(
+        "mutator",
+        [
+            _keep_only_ids,
+            lambda m: m["steps"]["M1_parse"].update({"status": "invalid_status"}),
+            lambda m: m["summary"].update({"messages_total": -1}),
+            lambda m: m.update({"schema_version": "not-semver"}),
+        ],
+        ids=["missing_required_field", "invalid_step_status", "negative_count", "bad_schema_version"],
+    )
+    def test_invalid_manifest_fails(
+        self,
+        mutator: Callable[[dict], Any],
+        base_manifest: dict,
+    ) -> None:
+        """A single mutation of a valid manifest should fail validation."""
+        bad = copy.deepcopy(base_manifest)
+        mutator(bad)
+
+        with pytest.raises(jsonschema.ValidationError):
+            validate_manifest(bad)
 
 
 class TestStepProgressSchema:
@@ -206,36 +180,10 @@ class TestStepProgressSchema:
         # Should not raise
         validate_manifest(manifest_data)
 
-    def test_step_with_all_valid_statuses(self) -> None:
+    @pytest.mark.parametrize("status", ["pending", "running", "ok", "failed", "skipped"])
+    def test_step_with_all_valid_statuses(self, status: str) -> None:
         """All valid step statuses should pass validation."""
-        valid_statuses = ["pending", "running", "ok", "failed", "skipped"]
-
-        for status in valid_statuses:
-            manifest_data = {
-                "schema_version": MANIFEST_SCHEMA_VERSION,
-                "run_id": "test-run-001",
-                "root": "/path/to/root",
-                "chat_file": "/path/to/chat.txt",
-                "run_dir": "/path/to/run",
-                "start_time": "2024-11-20T10:00:00Z",
-                "end_time": None,
-                "steps": {
-                    "M1_parse": {
-                        "name": "M1_parse",
-                        "status": status,
-                        "total": 100,
-                        "done": 50,
-                        "error": None,
-                        "started_at": None,
-                        "ended_at": None,
-                    }
-                },
-                "summary": {
-                    "messages_total": 100,
-                    "voice_total": 10,
-                    "error": None,
-                },
-            }
+        manifest_data = {**_BASE_MANIFEST, "steps": {"M1_parse": {**_BASE_STEP, "status": status}}}
 
-            # Should not raise
-            validate_manifest(manifest_data)
+        # Should not raise
+        validate_manifest(manifest_data)
@@ -10,6 +10,17 @@ from src.media_resolver import MediaResolver
 from src.parser_agent import ParserAgent
 from src.schema.message import Message
 from src.utils.hashing import sha256_file
+from tests._paths import FIXTURE_DIR
+
+pytestmark = pytest.mark.usefixtures("memo_sha256")
+
+
+@pytest.fixture(scope="session")
+def media_easy_readonly(tmp_path_factory):
+    """One shared copy of the easy fixture; ParserAgent/MediaResolver only read from root."""
+    dst = tmp_path_factory.mktemp("media_easy_ro")
+    shutil.copytree(FIXTURE_DIR / "media_easy", dst, dirs_exist_ok=True)
+    return dst
 
 
 def _prepare_fixture(root: Path):
@@ -19,11 +30,8 @@ def _prepare_fixture(root: Path):
         exceptions.unlink()
 
 
-def test_easy_fixture_resolution(tmp_path, monkeypatch):
-    fixture_root = Path(__file__).parent / "fixtures" / "media_easy"
-    # Copy fixture to tmp to avoid mutating timestamps
-    run_root = tmp_path / "easy"
-    shutil.copytree(fixture_root, run_root)
+def test_easy_fixture_resolution(media_easy_readonly):
+    run_root = media_easy_readonly
 
     agent = ParserAgent(root=str(run_root))
     msgs = agent.parse()
@@ -39,9 +47,9 @@ def test_easy_fixture_resolution(tmp_path, monkeypatch):
 
 
 def test_ambiguous_yields_csv_and_no_assignment(tmp_path, monkeypatch):
-    fixture_root = Path(__file__).parent / "fixtures" / "media_ambiguous"
-    run_root = tmp_path / "ambiguous"
-    shutil.copytree(fixture_root, run_root)
+    # Inputs are only read; isolate the exceptions.csv side effect via cwd instead
+    run_root = FIXTURE_DIR / "media_ambiguous"
+    monkeypatch.chdir(tmp_path)
 
     agent = ParserAgent(root=str(run_root))
     msgs = agent.parse()
@@ -60,15 +68,13 @@ def test_ambiguous_yields_csv_and_no_assignment(tmp_path, monkeypatch):
 
 
 def test_hashing_streaming():
-    path = Path(__file__).parent / "fixtures" / "media_easy" / "IMG-20250101-WA0001.jpg"
+    path = FIXTURE_DIR / "media_easy" / "IMG-20250101-WA0001.jpg"
     expected = sha256_file(path)
     assert len(expected) == 64  # hex digest length
 
 
-def test_media_hash_in_outputs(tmp_path):
-    fixture_root = Path(__file__).parent / "fixtures" / "media_easy"
-    run_root = tmp_path / "easy2"
-    shutil.copytree(fixture_root, run_root)
+def test_media_hash_in_outputs(media_easy_readonly):
+    run_root = media_easy_readonly
 
     agent = ParserAgent(root=str(run_root))
     msgs = agent.parse()
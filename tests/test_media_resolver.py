@@ -2,12 +2,20 @@
 
 from pathlib import Path
 
+import pytest
+
 from src.media_resolver import MediaResolver, ResolverConfig
 from src.indexer.media_index import FileInfo
 from src.writers.exceptions_csv import write_exceptions
 from src.schema.message import Message
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    """map_media writes exceptions.csv to cwd; keep it per-test so workers never share it."""
+    monkeypatch.chdir(tmp_path)
+
+
 def test_media_resolver_instantiates(tmp_path):
     """Ensure MediaResolver can be constructed."""
     resolver = MediaResolver(root=tmp_path)
@@ -10,12 +10,6 @@ import pytest
 from src.pipeline.metrics import METRICS_SCHEMA_VERSION, RunMetrics, validate_metrics
 
 
-@pytest.fixture
-def repo_root() -> Path:
-    """Get repository root directory."""
-    return Path(__file__).resolve().parents[1]
-
-
 @pytest.fixture
 def metrics_schema_path(repo_root: Path) -> Path:
     """Get path to metrics schema file."""
@@ -13,69 +13,26 @@ import pytest
 
 from src.parser_agent import ParserAgent
 from src.schema.message import Message
-from src.utils.dates import detect_datetime_format, parse_ts
+from src.utils.dates import (
+    DETECTION_SAMPLE_LINES,
+    _parse_ts_core,
+    detect_datetime_format,
+    parse_ts,
+)
 
 
-@pytest.fixture
-def header_lines():
-    """Load header cases fixture."""
-    fixture_path = Path(__file__).parent / "fixtures/text_only/header_cases.txt"
-    with open(fixture_path, encoding="utf-8") as f:
-        return f.readlines()
-
-
-@pytest.fixture
-def multiline_lines():
-    """Load multiline cases fixture."""
-    fixture_path = Path(__file__).parent / "fixtures/text_only/multiline.txt"
-    with open(fixture_path, encoding="utf-8") as f:
-        return f.readlines()
-
-
-@pytest.fixture
-def kind_lines():
-    """Load kind detection fixture."""
-    fixture_path = Path(__file__).parent / "fixtures/text_only/kinds.txt"
-    with open(fixture_path, encoding="utf-8") as f:
-        return [line.strip() for line in f.readlines()]
-
-
-@pytest.fixture
-def caption_lines():
-    """Load caption merge fixture."""
-    fixture_path = Path(__file__).parent / "fixtures/text_only/caption_merge.txt"
-    with open(fixture_path, encoding="utf-8") as f:
-        return f.readlines()
-
-
-@pytest.fixture
-def system_lines():
-    """Load system lines fixture."""
-    fixture_path = Path(__file__).parent / "fixtures/text_only/system_lines.txt"
-    with open(fixture_path, encoding="utf-8") as f:
-        return f.readlines()
+@pytest.fixture(scope="class")
+def parser(tmp_path_factory):
+    """ParserAgent shared per test class; it holds no per-call state."""
+    return ParserAgent(root=str(tmp_path_factory.mktemp("parser")))
 
 
 class TestDatetimeFormatDetection:
     """Tests for detect_datetime_format function."""
 
-    @pytest.fixture
-    def sample_24h_lines(self):
-        """Load sample 24h format chat file."""
-        fixture_path = Path(__file__).parent / "fixtures/text_only/sample_24h.txt"
-        with open(fixture_path, encoding="utf-8") as f:
-            return f.readlines()
-
-    @pytest.fixture
-    def sample_12h_lines(self):
-        """Load sample 12h format chat file."""
-        fixture_path = Path(__file__).parent / "fixtures/text_only/sample_12h.txt"
-        with open(fixture_path, encoding="utf-8") as f:
-            return f.readlines()
-
-    def test_detect_datetime_format_24h(self, sample_24h_lines):
+    def test_detect_datetime_format_24h(self, sample_24h_fmt):
         """Test detection of 24-hour timestamp format."""
-        fmt = detect_datetime_format(sample_24h_lines)
+        fmt = sample_24h_fmt
 
         # Verify correct format detected
         assert fmt["name"] == "24h_EN"
@@ -90,9 +47,9 @@ class TestDatetimeFormatDetection:
         parsed = parse_ts(sample_ts, fmt)
         assert parsed == "2025-07-08T14:23:00"
 
-    def test_detect_datetime_format_12h(self, sample_12h_lines):
+    def test_detect_datetime_format_12h(self, sample_12h_fmt):
         """Test detection of 12-hour (AM/PM) timestamp format."""
-        fmt = detect_datetime_format(sample_12h_lines)
+        fmt = sample_12h_fmt
 
         # Verify correct format detected
         assert fmt["name"] == "12h_EN"
@@ -115,6 +72,17 @@ class TestDatetimeFormatDetection:
         assert fmt1["name"] == fmt2["name"]
         assert fmt1["strptime_pattern"] == fmt2["strptime_pattern"]
 
+    def test_detect_consumes_only_sample_window(self):
+        """Detection should stop reading an iterable after the sampling window."""
+
+        def lines():
+            for _ in range(DETECTION_SAMPLE_LINES):
+                yield "7/8/25, 14:23 - Alice: Hello\n"
+            raise AssertionError("read past the sampling window")
+
+        fmt = detect_datetime_format(lines())
+        assert fmt["name"] == "24h_EN"
+
     def test_detect_empty_lines_ignored(self):
         """Test that empty lines are ignored during detection."""
         lines = [
@@ -214,6 +182,20 @@ class TestTimestampParsing:
         result2 = parse_ts(ts, fmt)
         assert result1 == result2
 
+    def test_parse_repeated_timestamp_is_memoized(self):
+        """Repeated timestamps (after normalization) should be served from the cache."""
+        fmt = {
+            "name": "12h_EN",
+            "regex": None,
+            "strptime_pattern": "%m/%d/%y, %I:%M %p",
+            "tz_placeholder": None,
+        }
+
+        assert parse_ts("7/9/25, 3:05 PM", fmt) == "2025-07-09T15:05:00"
+        hits = _parse_ts_core.cache_info().hits
+        assert parse_ts(" 7/9/25, 3:05\u202fPM ", fmt) == "2025-07-09T15:05:00"
+        assert _parse_ts_core.cache_info().hits == hits + 1
+
     def test_parse_invalid_timestamp_raises(self):
         """Test that ValueError is raised for invalid timestamps."""
         fmt = {
@@ -245,43 +227,27 @@ class TestTimestampParsing:
 class TestIntegration:
     """Integration tests combining detection and parsing."""
 
-    def test_end_to_end_24h(self):
-        """Test full workflow: detect format, parse multiple timestamps (24h)."""
-        lines = [
-            "7/8/25, 14:23 - Alice: Hello",
-            "7/8/25, 14:24 - Bob: Hi",
-            "7/8/25, 15:00 - Alice: How are you?",
-        ]
-
-        fmt = detect_datetime_format(lines)
-        assert fmt["name"] == "24h_EN"
-
-        # Parse all timestamps
-        timestamps = ["7/8/25, 14:23", "7/8/25, 14:24", "7/8/25, 15:00"]
-        parsed = [parse_ts(ts, fmt) for ts in timestamps]
-
-        assert parsed == [
-            "2025-07-08T14:23:00",
-            "2025-07-08T14:24:00",
-            "2025-07-08T15:00:00",
-        ]
-
-    def test_end_to_end_12h(self):
-        """Test full workflow: detect format, parse multiple timestamps (12h)."""
+    @pytest.mark.parametrize(
+        "times,expected_name",
+        [
+            (["14:23", "14:24", "15:00"], "24h_EN"),
+            (["2:23 PM", "2:24 PM", "3:00 PM"], "12h_EN"),
+        ],
+        ids=["24h", "12h"],
+    )
+    def test_end_to_end(self, times, expected_name):
+        """Test full workflow: detect format, parse multiple timestamps."""
+        timestamps = [f"7/8/25, {t}" for t in times]
         lines = [
-            "7/8/25, 2:23 PM - Alice: Hello",
-            "7/8/25, 2:24 PM - Bob: Hi",
-            "7/8/25, 3:00 PM - Alice: How are you?",
+            f"{timestamps[0]} - Alice: Hello",
+            f"{timestamps[1]} - Bob: Hi",
+            f"{timestamps[2]} - Alice: How are you?",
         ]
 
         fmt = detect_datetime_format(lines)
-        assert fmt["name"] == "12h_EN"
-
-        # Parse all timestamps
-        timestamps = ["7/8/25, 2:23 PM", "7/8/25, 2:24 PM", "7/8/25, 3:00 PM"]
-        parsed = [parse_ts(ts, fmt) for ts in timestamps]
+        assert fmt["name"] == expected_name
 
-        assert parsed == [
+        assert [parse_ts(ts, fmt) for ts in timestamps] == [
             "2025-07-08T14:23:00",
             "2025-07-08T14:24:00",
             "2025-07-08T15:00:00",
@@ -291,24 +257,17 @@ class TestIntegration:
 class TestHeaderSplit:
     """Tests for ParserAgent._split_header."""
 
-    @pytest.fixture
-    def parser(self, tmp_path):
-        """Create a ParserAgent instance for testing."""
-        return ParserAgent(root=str(tmp_path))
-
-    def test_header_split_basic(self, parser, header_lines):
+    def test_header_split_basic(self, parser, header_lines, header_fmt):
         """Test basic header split with sender and body."""
-        fmt = detect_datetime_format(header_lines)
-        ts, sender, body = parser._split_header(header_lines[0], fmt)
+        ts, sender, body = parser._split_header(header_lines[0], header_fmt)
 
         assert ts == "7/8/25, 14:23"
         assert sender == "Alice"
         assert body == "Hello world"
 
-    def test_header_split_colon_in_sender(self, parser, header_lines):
+    def test_header_split_colon_in_sender(self, parser, header_lines, header_fmt):
         """Ensure only the first ': ' is used for splitting."""
-        fmt = detect_datetime_format(header_lines)
-        ts, sender, body = parser._split_header(header_lines[2], fmt)
+        ts, sender, body = parser._split_header(header_lines[2], header_fmt)
 
         assert ts == "7/8/25, 14:25"
         assert sender == "Bob"
@@ -324,10 +283,9 @@ class TestHeaderSplit:
         assert sender == "Alice"
         assert body == "Hello"
 
-    def test_header_split_non_header_continuation(self, parser, header_lines):
+    def test_header_split_non_header_continuation(self, parser, header_lines, header_fmt):
         """Lines without a leading timestamp should be treated as continuations."""
-        fmt = detect_datetime_format(header_lines)
-        ts, sender, body = parser._split_header(header_lines[-1], fmt)
+        ts, sender, body = parser._split_header(header_lines[-1], header_fmt)
 
         assert ts is None
         assert sender is None
@@ -337,15 +295,9 @@ class TestHeaderSplit:
 class TestMultilineJoiner:
     """Tests for ParserAgent._to_blocks."""
 
-    @pytest.fixture
-    def parser(self, tmp_path):
-        """Create a ParserAgent instance for testing."""
-        return ParserAgent(root=str(tmp_path))
-
-    def test_multiline_join_preserves_newlines(self, parser, multiline_lines):
+    def test_multiline_join_preserves_newlines(self, parser, multiline_lines, multiline_fmt):
         """Continuation lines should be aggregated with newline preservation."""
-        fmt = detect_datetime_format(multiline_lines)
-        blocks = parser._to_blocks(multiline_lines, fmt)
+        blocks = parser._to_blocks(multiline_lines, multiline_fmt)
 
         assert len(blocks) == 3
 
@@ -362,10 +314,9 @@ class TestMultilineJoiner:
             "Hello there\nThis is a continuation line\nAnd another line with emoji 😊"
         )
 
-    def test_multiline_no_false_splits(self, parser, multiline_lines):
+    def test_multiline_no_false_splits(self, parser, multiline_lines, multiline_fmt):
         """Non-header colons should not start a new block."""
-        fmt = detect_datetime_format(multiline_lines)
-        blocks = parser._to_blocks(multiline_lines, fmt)
+        blocks = parser._to_blocks(multiline_lines, multiline_fmt)
 
         second_block = blocks[1]
         assert second_block["ts"] == "7/8/25, 14:24"
@@ -377,11 +328,6 @@ class TestMultilineJoiner:
 class TestKindClassification:
     """Tests for ParserAgent._classify."""
 
-    @pytest.fixture
-    def parser(self, tmp_path):
-        """Create a ParserAgent instance for testing."""
-        return ParserAgent(root=str(tmp_path))
-
     def test_kind_detection_file_attached_voice_and_image(self, parser, kind_lines):
         """File attached lines should map to correct kinds and empty content."""
         line_voice = kind_lines[0]
@@ -446,10 +392,9 @@ class TestKindClassification:
         assert media_hint == "audio_omitted"
         assert content_text == ""
 
-    def test_system_lines_marked(self, parser, system_lines):
+    def test_system_lines_marked(self, parser, system_lines, system_fmt):
         """System phrases should be classified as system."""
-        fmt = detect_datetime_format(system_lines)
-        blocks = parser._to_blocks(system_lines, fmt)
+        blocks = parser._to_blocks(system_lines, system_fmt)
 
         system_bodies = system_lines[:6]
         for body in system_bodies:
@@ -458,10 +403,9 @@ class TestKindClassification:
             assert media_hint is None
             assert content_text == body.strip()
 
-    def test_system_lines_do_not_split_messages(self, parser, system_lines):
+    def test_system_lines_do_not_split_messages(self, parser, system_lines, system_fmt):
         """Continuation after normal message should stay in same block."""
-        fmt = detect_datetime_format(system_lines)
-        blocks = parser._to_blocks(system_lines, fmt)
+        blocks = parser._to_blocks(system_lines, system_fmt)
         normal_block = blocks[-1]
         assert "Another continuation line" in normal_block["raw_block"]
 
@@ -469,11 +413,6 @@ class TestKindClassification:
 class TestCaptionMerge:
     """Tests for ParserAgent._merge_captions."""
 
-    @pytest.fixture
-    def parser(self, tmp_path):
-        """Create a ParserAgent instance for testing."""
-        return ParserAgent(root=str(tmp_path))
-
     def test_caption_merge_positive(self, parser):
         """Consecutive media/text with same ts and sender should merge."""
         media_msg = Message(
@@ -539,19 +478,13 @@ class TestParseIntegration:
         fixture_root = Path(__file__).parent / "fixtures/text_only"
         return ParserAgent(root=str(fixture_root))
     
-    def test_smoke_cli_invocation(self, tmp_path):
+    def test_smoke_cli_invocation(self, capsys):
         """Ensure CLI runs and outputs JSONL."""
+        from scripts.parse_chat import main
+
         fixture_root = Path(__file__).parent / "fixtures/text_only"
-        cmd_path = Path(__file__).parent.parent / "scripts" / "parse_chat.py"
-        assert cmd_path.exists()
-        import subprocess, sys
-        result = subprocess.run(
-            [sys.executable, str(cmd_path), "--root", str(fixture_root)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        lines = [ln for ln in result.stdout.splitlines() if ln.strip()]
+        assert main(["--root", str(fixture_root)]) == 0
+        lines = [ln for ln in capsys.readouterr().out.splitlines() if ln.strip()]
         assert len(lines) >= 1
 
     def test_message_indexing_stable(self, parser):
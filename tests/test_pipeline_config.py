@@ -60,3 +60,23 @@ def test_pipeline_config_rejects_invalid_sampling(tmp_path):
         PipelineConfig(root=root, sample_every=0)
     with pytest.raises(ValueError):
         PipelineConfig(root=root, sample_limit=0)
+
+
+def test_pipeline_config_validate_requires_resume_from_m1(tmp_path):
+    root = tmp_path / "chat"
+    root.mkdir()
+    (root / "_chat.txt").write_text("7/8/25, 14:23 - Alice: hi\n", encoding="utf-8")
+    cfg = PipelineConfig(root=root, resume_from_m1=tmp_path / "missing.M1.jsonl")
+    with pytest.raises(FileNotFoundError):
+        cfg.validate()
+
+
+def test_pipeline_config_validate_rejects_resume_from_m1_with_sampling(tmp_path):
+    root = tmp_path / "chat"
+    root.mkdir()
+    (root / "_chat.txt").write_text("7/8/25, 14:23 - Alice: hi\n", encoding="utf-8")
+    m1 = tmp_path / "messages.M1.jsonl"
+    m1.write_text("", encoding="utf-8")
+    cfg = PipelineConfig(root=root, resume_from_m1=m1, sample_limit=5)
+    with pytest.raises(ValueError):
+        cfg.validate()
@@ -1,10 +1,17 @@
-from pathlib import Path
+import json
+import shutil
 
-from src.pipeline.runner import run_contract_pipeline
+import pytest
 
+from src.pipeline.config import PipelineConfig
+from src.pipeline.runner import run_contract_pipeline, run_pipeline
+from tests._paths import FIXTURE_DIR
 
-def test_run_contract_pipeline_text_only(tmp_path):
-    root = Path("tests/fixtures/text_only")
+
+def test_run_contract_pipeline_text_only(tmp_path, monkeypatch):
+    # Media resolution writes exceptions.csv to cwd; isolate it per test/worker.
+    monkeypatch.chdir(tmp_path)
+    root = FIXTURE_DIR / "text_only"
     run_dir = tmp_path / "run"
     summary = run_contract_pipeline(root, run_dir, "run-test")
     assert (run_dir / "messages.M1.jsonl").exists()
@@ -14,3 +21,20 @@ def test_run_contract_pipeline_text_only(tmp_path):
     assert (run_dir / "run_manifest.json").exists()
     assert (run_dir / "metrics.json").exists()
     assert summary["outputs"]["manifest"].endswith("run_manifest.json")
+
+
+def test_run_pipeline_invalid_resume_from_m1_marks_m1_failed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = tmp_path / "chat"
+    shutil.copytree(FIXTURE_DIR / "pipeline_small_chat", root)
+    bad_m1 = tmp_path / "bad.M1.jsonl"
+    bad_m1.write_text("not json\n", encoding="utf-8")
+    cfg = PipelineConfig(root=root, run_dir=tmp_path / "run", resume=False, resume_from_m1=bad_m1)
+
+    # validate_jsonl -> load_messages -> json.loads rejects the artifact.
+    with pytest.raises(json.JSONDecodeError, match="Expecting value"):
+        run_pipeline(cfg)
+
+    manifest = json.loads(cfg.manifest_path.read_bytes())
+    assert manifest["steps"]["M1_parse"]["status"] == "failed"
+    assert manifest["summary"]["error"].startswith("M1_parse: Expecting value")
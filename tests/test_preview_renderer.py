@@ -1,25 +1,13 @@
-import json
-from pathlib import Path
-
 import pytest
 
 from src.schema.message import Message
 from src.writers.text_renderer import format_preview_line, write_transcript_preview
+from tests._messages import load_messages_jsonl
+from tests._paths import FIXTURE_DIR
 
 
 def build_voice(idx: int, ts: str, sender: str, **kwargs) -> Message:
-    payload = {"idx": idx, "ts": ts, "sender": sender, "kind": "voice"}
-    payload.update(kwargs)
-    return Message(**payload)
-
-
-def _load_fixture_messages(path: Path) -> list[Message]:
-    msgs = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        msgs.append(Message(**json.loads(line)))
-    return msgs
+    return Message(idx=idx, ts=ts, sender=sender, kind="voice", **kwargs)
 
 
 def test_preview_basic_ok():
@@ -60,8 +48,8 @@ def test_preview_placeholder_when_empty_text():
 
 
 def test_write_transcript_preview_with_fixture(tmp_path):
-    fixture_dir = Path("tests/fixtures/chat_with_audio")
-    msgs = _load_fixture_messages(fixture_dir / "messages.jsonl")
+    fixture_dir = FIXTURE_DIR / "chat_with_audio"
+    msgs = load_messages_jsonl(fixture_dir / "messages.jsonl")
     out = tmp_path / "preview.txt"
     count = write_transcript_preview(msgs, out, max_chars=120)
     assert count == 2  # two voice messages in fixture
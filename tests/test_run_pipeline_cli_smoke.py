@@ -1,25 +1,47 @@
-import sys
-from pathlib import Path
+import os
 
 import scripts.run_pipeline as run_pipeline_script
+from src.pipeline.config import PipelineConfig
 
 
-def test_run_pipeline_cli_smoke(tmp_path, pipeline_sample_root, stub_transcriber, monkeypatch):
+def _audio_workers() -> int:
+    """Audio workers for the smoke run: CPU count, capped by TEST_MAX_AUDIO_WORKERS."""
+    return max(1, min(os.cpu_count() or 2, int(os.environ.get("TEST_MAX_AUDIO_WORKERS", "4"))))
+
+
+def test_run_pipeline_cli_smoke(tmp_path, pipeline_sample_root, stub_transcriber):
     run_dir = tmp_path / "cli-run"
-    args = [
-        "run_pipeline.py",
-        "--root",
-        str(pipeline_sample_root),
-        "--run-dir",
-        str(run_dir),
-        "--run-id",
-        "cli-test",
-        "--max-workers-audio",
-        "2",
-        "--no-resume",
-    ]
-    monkeypatch.setattr(sys, "argv", args)
-    exit_code = run_pipeline_script.main()
+    cfg = PipelineConfig(
+        root=pipeline_sample_root,
+        run_dir=run_dir,
+        run_id="cli-test",
+        max_workers_audio=_audio_workers(),
+        resume=False,
+    )
+    exit_code = run_pipeline_script._main_with_config(cfg)
     assert exit_code == 0
     assert (run_dir / "run_manifest.json").exists()
     assert (run_dir / "metrics.json").exists()
+
+
+def test_run_pipeline_cli_args_build_config(tmp_path, pipeline_sample_root):
+    run_dir = tmp_path / "cli-run"
+    args = run_pipeline_script.parse_args(
+        [
+            "--root",
+            str(pipeline_sample_root),
+            "--run-dir",
+            str(run_dir),
+            "--run-id",
+            "cli-test",
+            "--max-workers-audio",
+            "3",
+            "--no-resume",
+        ]
+    )
+    cfg = PipelineConfig.from_args(args)
+    assert cfg.root == pipeline_sample_root.resolve()
+    assert cfg.run_dir == run_dir.resolve()
+    assert cfg.run_id == "cli-test"
+    assert cfg.max_workers_audio == 3
+    assert cfg.resume is False
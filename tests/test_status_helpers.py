@@ -11,15 +11,17 @@ import pytest
 from src.pipeline.status import (
     RunSummary,
     StepStatus,
+    count_transcript_preview_lines,
     list_runs,
     load_run_summary,
     load_transcript_preview,
 )
 
 
-@pytest.fixture
-def sample_run(tmp_path: Path) -> Path:
-    """Create a sample run directory with manifest and metrics."""
+@pytest.fixture(scope="module")
+def sample_run(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a read-only sample run directory with manifest and metrics."""
+    tmp_path = tmp_path_factory.mktemp("runs_root")
     run_dir = tmp_path / "runs" / "test-run"
     run_dir.mkdir(parents=True)
 
@@ -77,9 +79,7 @@ def sample_run(tmp_path: Path) -> Path:
             "resume_enabled": True,
         },
     }
-    (run_dir / "run_manifest.json").write_text(
-        json.dumps(manifest, indent=2), encoding="utf-8"
-    )
+    (run_dir / "run_manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
 
     # Write metrics
     metrics = {
@@ -92,9 +92,7 @@ def sample_run(tmp_path: Path) -> Path:
         "asr_cost_total_usd": 0.05,
         "wall_clock_seconds": 300.0,
     }
-    (run_dir / "metrics.json").write_text(
-        json.dumps(metrics, indent=2), encoding="utf-8"
-    )
+    (run_dir / "metrics.json").write_text(json.dumps(metrics), encoding="utf-8")
 
     # Write preview
     preview_lines = [
@@ -115,7 +113,7 @@ def sample_run(tmp_path: Path) -> Path:
 
 def test_list_runs_finds_runs(sample_run: Path):
     """list_runs should find runs with manifests."""
-    runs = list_runs(str(sample_run))
+    runs = list_runs(sample_run)
     assert len(runs) == 1
     assert runs[0].run_id == "test-run"
     assert runs[0].status == "ok"
@@ -123,7 +121,7 @@ def test_list_runs_finds_runs(sample_run: Path):
 
 def test_list_runs_empty_directory(tmp_path: Path):
     """list_runs should return empty list for empty directory."""
-    runs = list_runs(str(tmp_path))
+    runs = list_runs(str(tmp_path))  # plain str paths are accepted too
     assert runs == []
 
 
@@ -137,14 +135,14 @@ def test_list_runs_skips_invalid(tmp_path: Path):
     bad_run.mkdir(parents=True)
     (bad_run / "run_manifest.json").write_text("not json", encoding="utf-8")
 
-    runs = list_runs(str(tmp_path))
+    runs = list_runs(tmp_path)
     assert runs == []
 
 
 def test_load_run_summary_populates_fields(sample_run: Path):
     """load_run_summary should populate all fields correctly."""
     run_dir = sample_run / "runs" / "test-run"
-    summary = load_run_summary(str(run_dir))
+    summary = load_run_summary(run_dir)
 
     assert summary.run_id == "test-run"
     assert summary.status == "ok"
@@ -177,7 +175,7 @@ def test_load_run_summary_missing_metrics(tmp_path: Path):
         json.dumps(manifest), encoding="utf-8"
     )
 
-    summary = load_run_summary(str(run_dir))
+    summary = load_run_summary(run_dir)
     assert summary.run_id == "minimal"
     assert summary.audio_seconds == 0.0
     assert summary.asr_cost_usd == 0.0
@@ -202,7 +200,7 @@ def test_load_run_summary_failed_status(tmp_path: Path):
         json.dumps(manifest), encoding="utf-8"
     )
 
-    summary = load_run_summary(str(run_dir))
+    summary = load_run_summary(run_dir)
     assert summary.status == "failed"
     assert "Test error" in summary.error
 
@@ -210,26 +208,43 @@ def test_load_run_summary_failed_status(tmp_path: Path):
 def test_load_transcript_preview_parses_file(sample_run: Path):
     """load_transcript_preview should read and return lines."""
     run_dir = sample_run / "runs" / "test-run"
-    lines = load_transcript_preview(str(run_dir))
+    lines = load_transcript_preview(run_dir)
 
     assert len(lines) == 7
     assert lines[0] == "--- Message 1 ---"
     assert "مرحبا" in lines[6]  # UTF-8 Arabic
 
 
+def test_count_transcript_preview_lines_matches_load(sample_run: Path, tmp_path: Path):
+    """count_transcript_preview_lines should agree with load_transcript_preview."""
+    run_dir = sample_run / "runs" / "test-run"
+    assert count_transcript_preview_lines(run_dir) == len(load_transcript_preview(run_dir))
+    assert count_transcript_preview_lines(tmp_path) == 0
+
+
 def test_load_transcript_preview_missing_file(tmp_path: Path):
     """load_transcript_preview should return empty list for missing file."""
-    lines = load_transcript_preview(str(tmp_path))
+    lines = load_transcript_preview(tmp_path)
     assert lines == []
 
 
 def test_load_transcript_preview_empty_file(tmp_path: Path):
     """load_transcript_preview should handle empty file."""
     (tmp_path / "preview_transcripts.txt").write_text("", encoding="utf-8")
-    lines = load_transcript_preview(str(tmp_path))
+    lines = load_transcript_preview(tmp_path)
     assert lines == []  # Empty string splitlines returns empty list
 
 
+def test_load_transcript_preview_crlf_and_trailing_newline(tmp_path: Path):
+    """load_transcript_preview should strip CRLF endings and the final newline."""
+    # b"\xd9\x85..." is "مرحبا" in UTF-8.
+    (tmp_path / "preview_transcripts.txt").write_bytes(
+        b"a\r\n\xd9\x85\xd8\xb1\xd8\xad\xd8\xa8\xd8\xa7\r\n\r\nb\n"
+    )
+    lines = load_transcript_preview(tmp_path)
+    assert lines == ["a", "مرحبا", "", "b"]
+
+
 def test_step_status_dataclass():
     """StepStatus should be a valid dataclass."""
     step = StepStatus(
@@ -1,25 +1,17 @@
 from pathlib import Path
-import json
 
 import pytest
 
 from src.schema.message import Message
 from src.writers.text_renderer import TextRenderOptions, render_messages_to_txt
+from tests._messages import load_messages_jsonl
+from tests._paths import FIXTURE_DIR
 
-
-def build_message(idx: int, kind: str, ts: str, sender: str, **kwargs) -> Message:
-    payload = {"idx": idx, "ts": ts, "sender": sender, "kind": kind}
-    payload.update(kwargs)
-    return Message(**payload)
+CHAT_FIXTURE_DIR = FIXTURE_DIR / "chat_with_audio"
 
 
-def _load_fixture_messages(path: Path) -> list[Message]:
-    msgs = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        msgs.append(Message(**json.loads(line)))
-    return msgs
+def build_message(idx: int, kind: str, ts: str, sender: str, **kwargs) -> Message:
+    return Message(idx=idx, ts=ts, sender=sender, kind=kind, **kwargs)
 
 
 def _read_lines(path: Path) -> list[str]:
@@ -93,17 +85,25 @@ def test_multiline_indent_and_flatten(tmp_path):
     assert lines2[0].endswith("line1")
 
 
-def test_renderer_goldens_from_fixture(tmp_path):
-    fixture_dir = Path("tests/fixtures/chat_with_audio")
-    msgs = _load_fixture_messages(fixture_dir / "messages.jsonl")
-    out_basic = tmp_path / "basic.txt"
-    render_messages_to_txt(msgs, out_basic)
-    assert _read_lines(out_basic) == _read_lines(fixture_dir / "expected_basic.txt")
+@pytest.fixture(scope="module")
+def fixture_messages():
+    """chat_with_audio messages shared read-only by the golden variants."""
+    return load_messages_jsonl(CHAT_FIXTURE_DIR / "messages.jsonl")
 
-    out_hide = tmp_path / "hide.txt"
-    render_messages_to_txt(msgs, out_hide, TextRenderOptions(hide_system=True))
-    assert _read_lines(out_hide) == _read_lines(fixture_dir / "expected_hide_system.txt")
 
-    out_status = tmp_path / "status.txt"
-    render_messages_to_txt(msgs, out_status, TextRenderOptions(show_status=True))
-    assert _read_lines(out_status) == _read_lines(fixture_dir / "expected_show_status.txt")
+@pytest.mark.parametrize(
+    "options, expected_name",
+    [
+        (None, "expected_basic.txt"),
+        (TextRenderOptions(hide_system=True), "expected_hide_system.txt"),
+        (TextRenderOptions(show_status=True), "expected_show_status.txt"),
+    ],
+    ids=["basic", "hide_system", "show_status"],
+)
+def test_renderer_goldens_from_fixture(tmp_path, fixture_messages, options, expected_name):
+    out = tmp_path / "out.txt"
+    render_messages_to_txt(fixture_messages, out, options)
+    expected = CHAT_FIXTURE_DIR / expected_name
+    # Fast bytes compare; decode to lines only when it differs (readable diff, CRLF checkouts).
+    if out.read_bytes() != expected.read_bytes():
+        assert _read_lines(out) == _read_lines(expected)
@@ -2,98 +2,34 @@
 
 from __future__ import annotations
 
+import importlib
 import sys
 from pathlib import Path
-import os
-from unittest.mock import patch, MagicMock
 
 import pytest
 
 
-class SessionState(dict):
-    """Simple dict with attribute access to mimic Streamlit session state."""
+@pytest.fixture(scope="module")
+def ui_app_module(patched_streamlit):
+    """Import scripts.ui_app once against the mocked streamlit for this module."""
+    sys.modules.pop("scripts.ui_app", None)
+    return importlib.import_module("scripts.ui_app")
 
-    def __getattr__(self, item):
-        return self[item]
 
-    def __setattr__(self, key, value):
-        self[key] = value
+@pytest.fixture
+def mock_st(patched_streamlit, ui_app_module):
+    """The module's streamlit mock with call records and session state cleared."""
+    patched_streamlit.reset_mock()
+    patched_streamlit.session_state.clear()
+    return patched_streamlit
 
 
-def _make_mock_streamlit():
-    mock = MagicMock()
-    mock.set_page_config = MagicMock()
-    mock.title = MagicMock()
-    mock.session_state = SessionState()
-
-    def _columns(spec):
-        count = spec if isinstance(spec, int) else len(spec)
-
-        def _make_col():
-            col = MagicMock()
-            col.__enter__.return_value = None
-            col.__exit__.return_value = False
-            return col
-
-        return tuple(_make_col() for _ in range(count))
-
-    mock.columns.side_effect = _columns
-    mock.header = MagicMock()
-    mock.subheader = MagicMock()
-    mock.divider = MagicMock()
-    mock.metric = MagicMock()
-    mock.caption = MagicMock()
-    mock.table = MagicMock()
-    mock.text_area = MagicMock()
-    mock.json = MagicMock()
-    mock.info = MagicMock()
-    mock.warning = MagicMock()
-    mock.error = MagicMock()
-    mock.success = MagicMock()
-    mock.rerun = MagicMock()
-
-    class _Expander:
-        def __enter__(self):
-            return None
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-    mock.expander.side_effect = lambda *args, **kwargs: _Expander()
-
-    mock.button.side_effect = lambda *a, **k: False
-    mock.text_input.side_effect = lambda label, value="", **k: value
-    def _selectbox(label, options, **kwargs):
-        opts = list(options) if not isinstance(options, list) else options
-        return opts[0] if opts else None
-
-    mock.selectbox.side_effect = _selectbox
-    mock.checkbox.side_effect = lambda *a, **k: False
-    mock.number_input.side_effect = lambda label, **k: k.get("min_value", 1)
-    def _slider(label, *args, **kwargs):
-        if "value" in kwargs:
-            return kwargs["value"]
-        if "min_value" in kwargs:
-            return kwargs["min_value"]
-        return 1
-
-    mock.slider.side_effect = _slider
-
-    return mock
-
-
-def test_ui_app_imports_without_error(monkeypatch):
+def test_ui_app_imports_without_error(ui_app_module, mock_st):
     """Importing ui_app should not raise errors."""
-    mock_st = _make_mock_streamlit()
-    with patch.dict(os.environ, {"STREAMLIT_DISABLE_AUTORUN": "1"}), patch.dict(sys.modules, {"streamlit": mock_st}):
-        import importlib
-        import scripts.ui_app as ui_app
-        importlib.reload(ui_app)
-
-        ui_app.main()
+    ui_app_module.main()
 
-        assert mock_st.set_page_config.called
-        assert mock_st.title.called
+    assert mock_st.set_page_config.called
+    assert mock_st.title.called
 
 
 def test_status_module_imports():
@@ -114,18 +50,11 @@ def test_status_module_imports():
     assert callable(load_transcript_preview)
 
 
-def test_scan_chat_files_function(monkeypatch):
+def test_scan_chat_files_function(ui_app_module, mock_st):
     """scan_chat_files should work for valid directories."""
-    mock_st = _make_mock_streamlit()
-
-    with patch.dict(os.environ, {"STREAMLIT_DISABLE_AUTORUN": "1"}), patch.dict(sys.modules, {"streamlit": mock_st}):
-        import importlib
-        import scripts.ui_app as ui_app
-        importlib.reload(ui_app)
-
-        # Test with non-existent directory
-        result = ui_app.scan_chat_files("/nonexistent/path")
-        assert result == []
+    # Test with non-existent directory
+    result = ui_app_module.scan_chat_files("/nonexistent/path")
+    assert result == []
 
 
 def test_config_imports():